@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+"""Measures the cost of etaprogress' hot paths so versions can be compared.
+
+Measures ETA.set_numerator() updates per second at different scopes, __str__() frames per second of every progress bar
+class at different widths, and bytes allocated per update/frame (peak traced by tracemalloc while the call runs).
+
+Progress bar frames are measured twice: "changed" frames advance the clock and numerator before every str() call so the
+whole line is rebuilt (the numerator update is included), and "cached" frames call str() again with nothing changed so
+the previously built line is reused (only the spinner and animated bars are redrawn).
+
+Every instance gets a fake clock advancing a fixed amount per update, so the same data goes through the same code paths
+on every run and only the speed of the machine and of etaprogress changes. The terminal width is fixed too (the real
+terminal_width() is still called, so its cost is included).
+
+Usage:
+    python benchmarks/hot_paths.py [--json]
+
+Options:
+    --json      Print results as JSON (for saving and comparing between versions) instead of a table.
+"""
+
+from __future__ import print_function
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from etaprogress.components import misc  # noqa
+from etaprogress.eta import ETA  # noqa
+from etaprogress.progress import ProgressBar, ProgressBarBits, ProgressBarBytes, ProgressBarWget, ProgressBarYum  # noqa
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None  # Python 2.
+
+BARS = (('ProgressBar', ProgressBar, ()), ('ProgressBarBits', ProgressBarBits, ()),
+        ('ProgressBarBytes', ProgressBarBytes, ()), ('ProgressBarWget', ProgressBarWget, ()),
+        ('ProgressBarYum', ProgressBarYum, ('a_file_name.iso', )))
+DENOMINATOR = 10 ** 12
+FRAMES = 20000
+FRAME_UNITS = 10 ** 7  # Numerator increment per changed frame.
+MEMORY_SAMPLES = 200
+SCOPES = (60, 600, 6000)
+STEP = 0.01  # Seconds the fake clock advances per update.
+TIMER = getattr(time, 'perf_counter', time.time)
+UPDATES = 100000
+WIDTHS = (40, 80, 160)
+
+
+class FakeClock(object):
+    """Clock advancing STEP seconds every time it's read after tick()."""
+
+    def __init__(self):
+        self.now = 1411868720.0
+
+    def __call__(self):
+        return self.now
+
+    def tick(self):
+        """Advances the clock."""
+        self.now += STEP
+
+
+def allocated(function, samples):
+    """Returns the average peak number of bytes allocated while running function(), None without tracemalloc."""
+    if tracemalloc is None or not hasattr(tracemalloc, 'reset_peak'):
+        return None
+    total = 0
+    tracemalloc.start()
+    for _ in range(samples):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        function()
+        total += tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    return total / samples
+
+
+def bench_eta(scope):
+    """Returns updates per second and bytes allocated per update of ETA.set_numerator() with a full window."""
+    clock = FakeClock()
+    eta = ETA(DENOMINATOR, scope=scope, clock=clock)
+    numerator = [0]
+
+    def update():
+        clock.tick()
+        numerator[0] += 1000
+        eta.set_numerator(numerator[0])
+
+    for _ in range(scope):  # Fill the window first, the steady state is what matters.
+        update()
+    started = TIMER()
+    for _ in range(UPDATES):
+        update()
+    return UPDATES / (TIMER() - started), allocated(update, MEMORY_SAMPLES)
+
+
+def bench_bar(cls, args, width):
+    """Returns a dictionary of frames per second and bytes allocated per frame of str() on a progress bar.
+
+    Keys are 'changed' (clock and numerator advanced before every frame) and 'cached' (nothing changed between frames).
+    """
+    clock = FakeClock()
+    progress_bar = cls(DENOMINATOR, *args, max_width=width, clock=clock)
+    for i in range(1, 61):
+        clock.tick()
+        progress_bar.numerator = i * 10 ** 9
+
+    def changed():
+        clock.tick()
+        progress_bar.numerator += FRAME_UNITS
+        return str(progress_bar)
+
+    def cached():
+        return str(progress_bar)
+
+    results = dict()
+    for name, frame in (('changed', changed), ('cached', cached)):
+        started = TIMER()
+        for _ in range(FRAMES):
+            frame()
+        results[name] = (FRAMES / (TIMER() - started), allocated(frame, MEMORY_SAMPLES))
+    return results
+
+
+def main():
+    """Main function."""
+    original_terminal_width = misc.terminal_width
+
+    def terminal_width():
+        """Same cost as the real one, but always wide enough for max_width to decide."""
+        original_terminal_width()
+        return max(WIDTHS)
+    misc.terminal_width = terminal_width
+
+    results = dict(eta=dict(), bars=dict())
+    for scope in SCOPES:
+        results['eta'][str(scope)] = bench_eta(scope)
+    for name, cls, args in BARS:
+        results['bars'][name] = dict((str(w), bench_bar(cls, args, w)) for w in WIDTHS)
+    misc.terminal_width = original_terminal_width
+
+    if '--json' in sys.argv[1:]:
+        print(json.dumps(results, indent=2, sort_keys=True))
+        return
+
+    def memory(value):
+        return '{0:>7} B'.format('n/a' if value is None else int(round(value)))
+
+    print('ETA.set_numerator()')
+    print('{0:>18}  {1:>12}  {2:>9}'.format('scope', 'updates/s', 'alloc'))
+    for scope in SCOPES:
+        rate, bytes_ = results['eta'][str(scope)]
+        print('{0:>18}  {1:>12,.0f}  {2}'.format(scope, rate, memory(bytes_)))
+    for kind, title in (('changed', 'numerator changed every frame'), ('cached', 'nothing changed, line reused')):
+        print('\nstr(progress_bar), {0}'.format(title))
+        print('{0:>18}  {1}'.format('width', '  '.join('{0:>12}  {1:>9}'.format(w, 'alloc') for w in WIDTHS)))
+        for name, _, _ in BARS:
+            measured = (results['bars'][name][str(w)][kind] for w in WIDTHS)
+            columns = ('{0:>10,.0f}/s  {1}'.format(rate, memory(bytes_)) for rate, bytes_ in measured)
+            print('{0:>18}  {1}'.format(name, '  '.join(columns)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""Compares ETA timing data containers at different scopes to find where TimingNumpy starts paying off.
+
+Prints the mean cost of ETA.set_numerator() and the slowest single call for each container. The slowest call is the
+one that rebuilds the estimator's running sums (once per full window), which is a Python loop over every entry unless
+the timing data lives in NumPy arrays. Uses a fake clock so results don't depend on wall time.
+
+Usage:
+    python benchmarks/numpy_backend.py
+"""
+
+from __future__ import print_function
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from etaprogress import eta  # noqa
+from etaprogress.components.timing import import_numpy, NUMPY_THRESHOLD  # noqa
+
+CONTAINERS = (('deque', dict(use_numpy=False)), ('compact', dict(use_numpy=False, compact=True)),
+              ('numpy', dict(use_numpy=True)))
+SCOPES = (1000, 3000, 10000, 30000, 100000)
+TIMER = getattr(time, 'perf_counter', time.time)
+
+
+def run(scope, options):
+    """Feeds an ETA instance three full windows of entries. Returns mean and max seconds per set_numerator()."""
+    clock = [1411868720.0]
+    eta._NOW = lambda: clock[0]
+    eta_instance = eta.ETA(scope * 10, scope=scope, **options)
+    slowest, started = 0.0, TIMER()
+    for i in range(1, scope * 3 + 1):
+        clock[0] += 0.01
+        before = TIMER()
+        eta_instance.set_numerator(i)
+        slowest = max(slowest, TIMER() - before)
+    return (TIMER() - started) / (scope * 3), slowest
+
+
+def main():
+    """Main function."""
+    names = [n for n, _ in CONTAINERS if n != 'numpy' or import_numpy() is not None]
+    print('{0:>8}  {1}'.format('scope', '  '.join('{0:>22}'.format(n + ' mean/max') for n in names)))
+    for scope in SCOPES:
+        results = list()
+        for name, options in CONTAINERS:
+            if name not in names:
+                continue
+            mean, slowest = run(scope, options)
+            results.append('{0:>10.2f}us {1:>8.2f}ms'.format(mean * 1e6, slowest * 1e3))
+        print('{0:>8}  {1}'.format(scope, '  '.join(results)))
+    print('\nNUMPY_THRESHOLD = {0}'.format(NUMPY_THRESHOLD))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,8 +2,13 @@
 
 
 class BarUndefinedEmpty(object):
-    """Simplest progress bar. Just a static empty bar."""
+    """Simplest progress bar. Just a static empty bar.
 
+    Class variables:
+    ANIMATED -- True if bar() returns something different every call (progress bars redraw it on every render).
+    """
+
+    ANIMATED = False
     CHAR_LEFT_BORDER = '['
     CHAR_RIGHT_BORDER = ']'
     CHAR_EMPTY = ' '
@@ -23,6 +28,7 @@ class BarUndefinedEmpty(object):
 class BarUndefinedAnimated(BarUndefinedEmpty):
     """Progress bar with a character that moves back and forth."""
 
+    ANIMATED = True
     CHAR_ANIMATED = '?'
 
     def __init__(self):
@@ -1,24 +1,74 @@
 """Base class for all progress bars (including other data like rates and ETA)."""
 
-from etaprogress.eta import ETA
+from etaprogress.components.layout import Layout
+from etaprogress.eta import _unpack_state, ETA
 
 
 class BaseProgressBar(object):
-    """Holds common properties/methods/etc for ProgressBar and related subclasses."""
+    """Holds common properties/methods/etc for ProgressBar and related subclasses.
 
-    def __init__(self, denominator, max_width=None, eta_every=1):
-        self._eta = ETA(denominator=denominator)
+    Positional arguments:
+    denominator -- the final/total number of units (like the expected file size of a download). 0 if unknown.
+
+    Keyword arguments:
+    max_with -- limit number of characters shown (by default the full progress bar takes up the entire terminal width).
+    eta_every -- calculate and cache the ETA string after this many numerator setting iteration. Default is every iter.
+    eta_kwargs -- passed to the underlying etaprogress.eta.ETA instance (e.g. scope, window_seconds, clock). With
+        lazy=True, setting the numerator only records it. The rate and ETA string are calculated when the progress bar
+        is drawn. With min_interval, numerators held back by ETA don't regenerate the ETA string until they're added
+        (by the next update past the interval, flush(), or drawing the progress bar after the interval passes). With
+        stall_threshold, the ETA string is regenerated every time the progress bar is drawn while stalled.
+
+    Instance variables:
+    layout -- template of the full progress bar compiled by etaprogress.components.layout.Layout. Set by subclasses
+        through the template property.
+    _render_key -- tuple of everything the last drawn progress bar depended on (numerator, ETA string, width, etc).
+    _render_cache -- segments and flexible field widths filled in for _render_key, reused by __str__() until the key
+        changes. Only animated parts (spinner, animated bars) are put in on every call.
+    """
+
+    def __init__(self, denominator, max_width=None, eta_every=1, **eta_kwargs):
+        self._eta = ETA(denominator=denominator, **eta_kwargs)
         self.max_width = max_width
         self.eta_every = eta_every
         self.force_done = False
         self._eta_string = ''
+        self._eta_string_stale = False
         self._eta_count = 1
+        self._render_key = None
+        self._render_cache = None
 
     @staticmethod
     def _generate_eta(seconds):
         """Kind of like an interface method, to be implemented by subclasses."""
         raise NotImplementedError
 
+    @property
+    def _eta_string(self):
+        """Returns the cached ETA string, generating it first if outdated (lazy or stalled past stall_threshold)."""
+        if self._eta._pending is not None and self._eta._settle():  # Held back numerator added (min_interval only).
+            self._eta_string_stale = not self._eta.undefined
+        if self._eta_string_stale or (self._eta.stall_threshold and self._eta.stalled):
+            self._eta_string_stale = False
+            self._eta_string_cache = self._generate_eta(self._eta.eta_seconds)
+        return self._eta_string_cache
+
+    @_eta_string.setter
+    def _eta_string(self, value):
+        """Sets the cached ETA string."""
+        self._eta_string_stale = False
+        self._eta_string_cache = value
+
+    @property
+    def template(self):
+        """Returns the template string of the full progress bar."""
+        return self.layout.template
+
+    @template.setter
+    def template(self, value):
+        """Compiles and sets a new template. Also accepts an etaprogress.components.layout.Layout instance."""
+        self.layout = value if isinstance(value, Layout) else Layout(value)
+
     @property
     def denominator(self):
         """Returns the denominator as an integer."""
@@ -39,10 +89,18 @@ class BaseProgressBar(object):
     @numerator.setter
     def numerator(self, value):
         """Sets a new numerator and generates the ETA. Must be greater than or equal to previous numerator."""
+        # If lazy, the ETA string is generated the next time it's read.
+        if self._eta.lazy:
+            self._eta.numerator = value
+            if not self._eta.pending:
+                self._eta_string_stale = not self._eta.undefined
+            return
+
         # If ETA is every iteration, don't do anything fancy.
         if self.eta_every <= 1:
             self._eta.numerator = value
-            self._eta_string = self._generate_eta(self._eta.eta_seconds)
+            if not self._eta.pending:
+                self._eta_string = self._generate_eta(self._eta.eta_seconds)
             return
 
         # If ETA is not every iteration, unstable rate is used. If this bar is undefined, no point in calculating ever.
@@ -54,12 +112,68 @@ class BaseProgressBar(object):
         if self._eta_count >= self.eta_every:
             self._eta_count = 1
             self._eta.numerator = value
-            self._eta_string = self._generate_eta(self._eta.eta_seconds)
+            if not self._eta.pending:
+                self._eta_string = self._generate_eta(self._eta.eta_seconds)
             return
 
         self._eta_count += 1
         self._eta.set_numerator(value, calculate=False)
 
+    def add(self, delta):
+        """Adds units done without updating the numerator. Safe to call from many threads. See ETA.add().
+
+        Positional arguments:
+        delta -- number of units done since the previous call (by this thread).
+        """
+        self._eta.counter.add(delta)
+
+    def sample(self):
+        """Sets the numerator to the sum of all add() calls and generates the ETA. Call from one thread only."""
+        self.numerator = self._eta.counter.value
+
+    def flush(self):
+        """Adds the numerator held back by min_interval and generates the ETA. See etaprogress.eta.ETA.flush()."""
+        if not self._eta.pending:
+            return
+        self._eta.flush()
+        if self._eta.lazy:
+            self._eta_string_stale = not self._eta.undefined
+        else:
+            self._eta_string = self._generate_eta(self._eta.eta_seconds)
+
+    def extend(self, pairs):
+        """Adds many (timestamp, numerator) entries at once and generates the ETA. See etaprogress.eta.ETA.extend()."""
+        # Same as setting the numerator but the whole batch counts as one iteration.
+        if self.eta_every > 1 and self._eta.undefined:
+            self._eta.extend(pairs, calculate=False)
+            return
+        self._eta_count = 1
+        self._eta.extend(pairs)
+        self._eta_string = self._generate_eta(self._eta.eta_seconds)
+
+    def to_bytes(self):
+        """Returns the ETA state as a compact binary string. See etaprogress.eta.ETA.to_bytes()."""
+        return self._eta.to_bytes()
+
+    @classmethod
+    def from_bytes(cls, data, *args, **kwargs):
+        """Returns a new progress bar with the ETA state returned by to_bytes(). See etaprogress.eta.ETA.restore().
+
+        Positional arguments:
+        data -- binary string returned by to_bytes().
+        args -- passed to the new instance after the denominator (e.g. filename for ProgressBarYum).
+
+        Keyword arguments:
+        kwargs -- passed to the new instance (e.g. max_width, scope). denominator is taken from data.
+        """
+        progress_bar = cls(_unpack_state(data)[1], *args, **kwargs)  # Defined bars need the denominator up front.
+        progress_bar._eta.restore(data)
+        if progress_bar._eta.lazy:
+            progress_bar._eta_string_stale = not progress_bar._eta.undefined
+        else:
+            progress_bar._eta_string = progress_bar._generate_eta(progress_bar._eta.eta_seconds)
+        return progress_bar
+
     @property
     def percent(self):
         """Returns the percent as a float."""
@@ -0,0 +1,124 @@
+"""Counters incremented by workers and sampled by etaprogress.eta.ETA. Used with ETA.add() and ETA.sample()."""
+
+import ctypes
+from itertools import count
+import threading
+import weakref
+from multiprocessing.sharedctypes import RawArray
+
+
+class _ThreadToken(object):
+    """Kept in a thread's threading.local. Garbage collected when the thread exits, which folds the thread's shard."""
+
+    __slots__ = ('__weakref__', )
+
+
+class ShardedCounter(object):
+    """Counter incremented from many threads without contending on a lock. The default counter of ETA instances.
+
+    Each thread adds to its own shard (a 1-item list only that thread writes to). Reading the value sums all shards, so
+    the cost of merging is paid by the reader when it samples instead of by the workers on every increment. When a
+    thread exits its shard is folded into the initial value, so pools starting a thread per task don't make the
+    counter grow.
+
+    Keyword arguments:
+    initial -- starting value.
+
+    Instance variables:
+    _initial -- starting value plus the shards of exited threads.
+    _local -- threading.local instance holding the current thread's shard and token.
+    _shards -- dictionary of shards of live threads, keyed by registration number.
+    _tokens -- dictionary of weak references to each thread's token, keyed like _shards. Their callbacks fold shards.
+    _keys -- registration number generator.
+    _lock -- held while a thread registers or folds its shard (once per thread) and while reading the value.
+    """
+
+    def __init__(self, initial=0):
+        self._initial = initial
+        self._local = threading.local()
+        self._shards = dict()
+        self._tokens = dict()
+        self._keys = count()
+        self._lock = threading.RLock()  # Reentrant: a token may be collected while this thread holds the lock.
+
+    @property
+    def value(self):
+        """Returns the sum of all shards (plus the initial value)."""
+        with self._lock:
+            return self._initial + sum(shard[0] for shard in tuple(self._shards.values()))
+
+    def _fold(self, key):
+        """Adds the shard of an exited thread to the initial value and forgets it."""
+        with self._lock:
+            self._tokens.pop(key, None)
+            shard = self._shards.pop(key, None)
+            if shard is not None:
+                self._initial += shard[0]
+
+    def _register(self):
+        """Creates and returns the current thread's shard."""
+        shard = [0]
+        token = _ThreadToken()
+        with self._lock:
+            key = next(self._keys)
+            self._shards[key] = shard
+            self._tokens[key] = weakref.ref(token, lambda _, k=key: self._fold(k))
+        self._local.shard = shard
+        self._local.token = token
+        return shard
+
+    def add(self, delta):
+        """Adds delta to the current thread's shard.
+
+        Positional arguments:
+        delta -- number of units to add.
+        """
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._register()
+        shard[0] += delta
+
+
+class SharedCounter(object):
+    """Counter incremented from many processes through shared memory. Pass to ETA or progress bars with counter=.
+
+    Memory holds one double per slot (mmap-backed, see multiprocessing.sharedctypes.RawArray). Each worker process is
+    given its own slot and increments it with plain stores, no lock, pickling, or pipe involved. Reading the value sums
+    all slots, so the parent only pays for it when it samples. Values are floats (exact for integers up to 2**53).
+
+    Like other multiprocessing shared objects, instances must be passed to worker processes when they're created (e.g.
+    Process args or Pool initializer args), not through queues. Each slot must only be written by one process.
+
+    Positional arguments:
+    slots -- number of slots (usually the number of worker processes).
+
+    Keyword arguments:
+    initial -- starting value.
+    slot -- index of the slot add() increments in this process. Set it in each worker (e.g. counter.slot = index).
+
+    Instance variables:
+    slot -- index of the slot add() increments in this process.
+    _initial -- starting value.
+    _slots -- shared array of doubles.
+    """
+
+    def __init__(self, slots, initial=0, slot=0):
+        if slots < 1:
+            raise ValueError('slots must be a positive integer.')
+        self.slot = slot
+        self._initial = initial
+        self._slots = RawArray(ctypes.c_double, slots)
+
+    @property
+    def value(self):
+        """Returns the sum of all slots (plus the initial value)."""
+        return self._initial + sum(self._slots[:])
+
+    def add(self, delta):
+        """Adds delta to this process' slot.
+
+        Positional arguments:
+        delta -- number of units to add.
+        """
+        self._slots[self.slot] += delta
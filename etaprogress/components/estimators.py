@@ -0,0 +1,341 @@
+"""Rate and ETA estimators used by etaprogress.eta.ETA.
+
+ETA feeds every estimator the same way: add() when an entry is appended to its timing data, replace_last() when the
+latest entry is overwritten (same timestamp), remove() when the oldest entry leaves the window, and calculate() to get
+the current rate and ETA. Timestamps (x) are seconds since the ETA instance started, values (y) are numerators.
+
+Each ETA instance needs its own estimator instance.
+"""
+
+from __future__ import division
+
+from bisect import bisect_left, insort
+from collections import deque
+from math import sqrt
+
+from etaprogress.components.regression import LinearRegression
+
+
+class BaseEstimator(object):
+    """Interface for estimators. Subclasses must implement clear(), add(), and calculate()."""
+
+    def clear(self):
+        """Kind of like an interface method, to be implemented by subclasses. Forgets all entries."""
+        raise NotImplementedError
+
+    def reset(self, points=()):
+        """Forgets everything and starts over with these points.
+
+        Keyword arguments:
+        points -- iterable of 2-item tuples (x, y), oldest first.
+        """
+        self.clear()
+        for x, y in points:
+            self.add(x, y)
+
+    def resync(self, points):
+        """Called by ETA once per full window with all current timing data. Used to cancel out accumulated drift.
+
+        Positional arguments:
+        points -- iterable of 2-item tuples (x, y), oldest first.
+        """
+        pass
+
+    def add(self, x, y):
+        """Kind of like an interface method, to be implemented by subclasses. Called when an entry is appended."""
+        raise NotImplementedError
+
+    def remove(self, x, y):
+        """Called when the oldest entry is pushed off the window. Recursive estimators have nothing to do here."""
+        pass
+
+    def replace_last(self, old_x, old_y, x, y):
+        """Called when the latest entry (old_x, old_y) is overwritten by (x, y)."""
+        self.remove(old_x, old_y)
+        self.add(x, y)
+
+    def rate_error(self):
+        """Returns the standard error of the rate calculated by calculate(). None if not supported or unknown."""
+        return None
+
+    def calculate(self, x, y, denominator):
+        """Kind of like an interface method, to be implemented by subclasses.
+
+        Positional arguments:
+        x -- timestamp of the latest entry.
+        y -- numerator of the latest entry.
+        denominator -- the final/total number of units. None if undefined.
+
+        Returns:
+        2-item tuple, the rate (float) and the timestamp of completion (float, None if unknown or undefined).
+        """
+        raise NotImplementedError
+
+
+class EstimatorRegression(BaseEstimator):
+    """Simple linear regression over the whole window, blended with a fitted line near the end. The default.
+
+    Two linear lines are used to calculate the ETA: the linear regression (line through a scatter-plot), and the
+    fitted line (a line that runs through the latest data point but parallel to the linear regression line).
+
+    As the percentage moves closer to 100%, calculate() gradually uses the ETA based on the fitted line more and
+    more. This is done to prevent an ETA that's in the past.
+
+    Instance variables:
+    regression -- LinearRegression instance holding running sums of the window.
+    """
+
+    def __init__(self):
+        self.regression = LinearRegression()
+
+    def clear(self):
+        """Forgets all entries."""
+        self.regression.reset()
+
+    def reset(self, points=()):
+        """Forgets everything and starts over with these points. Vectorized if points is a TimingNumpy instance."""
+        if hasattr(points, 'columns'):
+            self.regression.reset_columns(*points.columns())
+        else:
+            self.regression.reset(points)
+
+    def resync(self, points):
+        """Rebuilds the running sums from scratch."""
+        self.reset(points)
+
+    def add(self, x, y):
+        """Adds an entry to the running sums."""
+        self.regression.add(x, y)
+
+    def remove(self, x, y):
+        """Removes an entry from the running sums."""
+        self.regression.remove(x, y)
+
+    def rate_error(self):
+        """Returns the standard error of the regression line's slope, from the running sums."""
+        return self.regression.slope_error
+
+    def calculate(self, x, y, denominator):
+        """Returns the regression line's slope and where the blended line reaches the denominator.
+
+        http://code.activestate.com/recipes/578914-simple-linear-regression-with-pure-python/
+        http://en.wikipedia.org/wiki/Pearson_product-moment_correlation_coefficient
+        """
+        # Calculate regression line. y = mx + b where m is the slope and b is the y-intercept.
+        regression = self.regression
+        m = regression.slope
+        if not denominator or not m:
+            return m, None  # Undefined or stalled, no way to tell when it will finish.
+        origin_x, origin_y = regression.origin
+        target = denominator - origin_y
+        b = regression.intercept
+        regression_x = (target - b) / m
+
+        # Calculate fitted line (transformed/shifted regression line horizontally).
+        fitted_b = (y - origin_y) - (m * (x - origin_x))
+        fitted_x = (target - fitted_b) / m
+        adjusted_x = ((fitted_x - regression_x) * (y / denominator)) + regression_x
+        return m, adjusted_x + origin_x
+
+
+class EstimatorEWMA(BaseEstimator):
+    """Exponentially weighted moving average of the rate between consecutive entries. O(1) per update.
+
+    Weights decay with time rather than with the number of entries, so irregularly spaced updates are handled. The
+    window limits (scope, window_seconds) don't apply, older entries simply fade out.
+
+    Keyword arguments:
+    half_life -- number of seconds after which an entry's weight is halved. Smaller values react faster to bursts.
+
+    Instance variables:
+    rate -- current smoothed rate.
+    """
+
+    def __init__(self, half_life=10.0):
+        self.half_life = half_life
+        self.rate = 0.0
+        self._last_x = None
+        self._last_y = None
+        self._rated = False
+        self._previous = (0.0, None, None, False)  # State before the latest add(), restored by replace_last().
+
+    def clear(self):
+        """Forgets all entries."""
+        self.__init__(self.half_life)
+
+    def add(self, x, y):
+        """Folds the rate since the previous entry into the average."""
+        self._previous = (self.rate, self._last_x, self._last_y, self._rated)
+        if self._last_x is not None and x > self._last_x:
+            instant = (y - self._last_y) / (x - self._last_x)
+            if self._rated:
+                decay = 0.5 ** ((x - self._last_x) / self.half_life)
+                self.rate = decay * self.rate + (1 - decay) * instant
+            else:
+                self.rate = instant
+                self._rated = True
+        self._last_x, self._last_y = x, y
+
+    def replace_last(self, old_x, old_y, x, y):
+        """Undoes the latest add() and adds the new entry instead."""
+        self.rate, self._last_x, self._last_y, self._rated = self._previous
+        self.add(x, y)
+
+    def calculate(self, x, y, denominator):
+        """Returns the smoothed rate and the time when the remaining units will be done at that rate."""
+        if not denominator or self.rate <= 0:
+            return self.rate, None
+        return self.rate, x + (denominator - y) / self.rate
+
+
+class EstimatorKalman(BaseEstimator):
+    """Constant-velocity Kalman filter tracking the numerator (position) and rate (velocity). O(1) per update.
+
+    Reacts to real rate changes while smoothing out bursts, weighing each update by how far apart in time it is from
+    the previous one. Noise parameters are relative to the first measured rate so they work with any unit. The window
+    limits (scope, window_seconds) don't apply.
+
+    Keyword arguments:
+    process_noise -- how much the rate is expected to drift per second, as a fraction of the first measured rate.
+    measurement_noise -- how noisy numerators are, in seconds worth of progress at the first measured rate.
+
+    Instance variables:
+    position -- filtered numerator.
+    rate -- filtered rate.
+    """
+
+    def __init__(self, process_noise=0.05, measurement_noise=1.0):
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        self.position = 0.0
+        self.rate = 0.0
+        self._last_x = None
+        self._q = self._r = 0.0  # Process and measurement noise variances, scaled once the first rate is known.
+        self._p = (0.0, 0.0, 0.0)  # Covariance matrix (p00, p01, p11), it's symmetric.
+        self._previous = None  # State before the latest add(), restored by replace_last().
+
+    def clear(self):
+        """Forgets all entries."""
+        self.__init__(self.process_noise, self.measurement_noise)
+
+    def add(self, x, y):
+        """Predicts the state at x then corrects it with the measured numerator y."""
+        self._previous = (self.position, self.rate, self._last_x, self._q, self._r, self._p)
+        if self._last_x is None:
+            self.position, self._last_x = float(y), x
+            return
+        dt = x - self._last_x
+        if dt <= 0:
+            return
+        self._last_x = x
+
+        # Initialize with the first rate.
+        if not self._r:
+            rate = (y - self.position) / dt
+            scale = abs(rate) or 1.0
+            self._q = (self.process_noise * scale) ** 2
+            self._r = (self.measurement_noise * scale) ** 2
+            self.position, self.rate = float(y), rate
+            self._p = (self._r, self._r / dt, 2 * self._r / (dt * dt))
+            return
+
+        # Predict.
+        p00, p01, p11 = self._p
+        position = self.position + self.rate * dt
+        p00 += dt * (2 * p01 + dt * p11) + self._q * dt ** 3 / 3
+        p01 += dt * p11 + self._q * dt ** 2 / 2
+        p11 += self._q * dt
+
+        # Update.
+        innovation = y - position
+        gain_position = p00 / (p00 + self._r)
+        gain_rate = p01 / (p00 + self._r)
+        self.position = position + gain_position * innovation
+        self.rate += gain_rate * innovation
+        self._p = ((1 - gain_position) * p00, (1 - gain_position) * p01, p11 - gain_rate * p01)
+
+    def replace_last(self, old_x, old_y, x, y):
+        """Undoes the latest add() and adds the new entry instead."""
+        self.position, self.rate, self._last_x, self._q, self._r, self._p = self._previous
+        self.add(x, y)
+
+    def rate_error(self):
+        """Returns the standard deviation of the filtered rate (from the covariance matrix)."""
+        return sqrt(self._p[2]) if self._r else None
+
+    def calculate(self, x, y, denominator):
+        """Returns the filtered rate and the time when the remaining units will be done at that rate."""
+        if not denominator or self.rate <= 0:
+            return self.rate, None
+        return self.rate, x + (denominator - y) / self.rate
+
+
+class EstimatorTheilSen(BaseEstimator):
+    """Theil-Sen estimator: the median slope between every pair of the latest `sample_size` entries.
+
+    A single burst (e.g. buffers being flushed) only affects the slopes to one entry so it barely moves the median,
+    unlike the mean-based regression which is skewed for the whole window. Slopes are kept sorted as entries come and
+    go, so each update costs at most `sample_size` insertions/deletions no matter how large the ETA's scope is.
+
+    Keyword arguments:
+    sample_size -- number of latest entries to use. Each update costs O(sample_size) slope insertions.
+
+    Instance variables:
+    _points -- deque of the latest 2-item tuples (x, y), oldest first.
+    _slopes -- sorted list of slopes between every pair of _points.
+    """
+
+    def __init__(self, sample_size=16):
+        self.sample_size = sample_size
+        self._points = deque()
+        self._slopes = list()
+
+    def clear(self):
+        """Forgets all entries."""
+        self.__init__(self.sample_size)
+
+    def _drop(self, index):
+        """Removes the oldest (0) or latest (-1) entry and its slopes. Slopes are recomputed exactly as in add()."""
+        x, y = self._points[index]
+        del self._points[index]
+        slopes = self._slopes
+        for other_x, other_y in self._points:
+            slope = (y - other_y) / (x - other_x) if index else (other_y - y) / (other_x - x)
+            del slopes[bisect_left(slopes, slope)]
+
+    def add(self, x, y):
+        """Adds the slopes between the new entry and the others, dropping the oldest entry if there are too many."""
+        if len(self._points) >= self.sample_size:
+            self._drop(0)
+        for other_x, other_y in self._points:
+            insort(self._slopes, (y - other_y) / (x - other_x))
+        self._points.append((x, y))
+
+    def remove(self, x, y):
+        """Drops the entry if it's still one of the latest `sample_size` entries."""
+        if self._points and self._points[0] == (x, y):
+            self._drop(0)
+
+    def replace_last(self, old_x, old_y, x, y):
+        """Drops the latest entry and adds the new one instead."""
+        self._drop(-1)
+        self.add(x, y)
+
+    @property
+    def slope(self):
+        """Returns the median slope. 0.0 if there are less than two entries."""
+        slopes = self._slopes
+        if not slopes:
+            return 0.0
+        return (slopes[len(slopes) // 2] + slopes[(len(slopes) - 1) // 2]) / 2
+
+    def calculate(self, x, y, denominator):
+        """Returns the median slope and where the line (blended with the fitted line like EstimatorRegression) ends."""
+        m = self.slope
+        if not denominator or m <= 0:
+            return m, None
+        intercepts = sorted(point_y - m * point_x for point_x, point_y in self._points)
+        b = (intercepts[len(intercepts) // 2] + intercepts[(len(intercepts) - 1) // 2]) / 2
+        median_x = (denominator - b) / m
+        fitted_x = x + (denominator - y) / m
+        return m, ((fitted_x - median_x) * (y / denominator)) + median_x
@@ -0,0 +1,143 @@
+"""Fixed memory histogram of rates, filled by etaprogress.eta.ETA when given one with histogram=."""
+
+from __future__ import division
+
+from array import array
+from math import frexp, ldexp
+
+
+class RateHistogram(object):
+    """Log-bucketed histogram (like HDR histograms) of rates with a fixed relative precision and fixed memory usage.
+
+    Each power of 2 is split into `sub_buckets` linear buckets, so values are kept within 1 / sub_buckets of their
+    actual value no matter how large they are. Recording is O(1). Values above the range are counted in the last
+    bucket, positive values below it in the first bucket, and 0 (stalled) in its own bucket.
+
+    ETA records the rate between every two consecutive entries, weighted by the number of seconds between them. So
+    percentiles are over the job's run time (e.g. p99 is the rate exceeded during only 1% of the time).
+
+    Keyword arguments:
+    sub_buckets -- number of buckets per power of 2. Higher is more precise but uses more memory.
+    min_exponent -- smallest power of 2 tracked. The default -10 is about 0.001 units per second.
+    max_exponent -- largest power of 2 tracked. The default 40 is about 1 trillion units per second.
+
+    Instance variables:
+    minimum -- smallest value recorded (exact). None if nothing was recorded.
+    maximum -- largest value recorded (exact). None if nothing was recorded.
+    total -- sum of all weights.
+    zero -- sum of weights of 0 values.
+    _counts -- array of sums of weights for each bucket.
+    _sum -- sum of values multiplied by their weights.
+    """
+
+    def __init__(self, sub_buckets=16, min_exponent=-10, max_exponent=40):
+        if sub_buckets < 1 or max_exponent <= min_exponent:
+            raise ValueError('invalid histogram layout.')
+        self.sub_buckets = sub_buckets
+        self.min_exponent = min_exponent
+        self.max_exponent = max_exponent
+        self.minimum = self.maximum = None
+        self.total = self.zero = self._sum = 0.0
+        self._counts = array('d', [0.0]) * ((max_exponent - min_exponent) * sub_buckets)
+
+    def _index(self, value):
+        """Returns the bucket index of a positive value."""
+        mantissa, exponent = frexp(value)  # value = mantissa * 2 ** exponent, 0.5 <= mantissa < 1.
+        if exponent <= self.min_exponent:
+            return 0
+        if exponent > self.max_exponent:
+            return len(self._counts) - 1
+        return (exponent - self.min_exponent - 1) * self.sub_buckets + int((mantissa - 0.5) * 2 * self.sub_buckets)
+
+    def _bounds(self, index):
+        """Returns a 2-item tuple, the low and high values of a bucket."""
+        exponent, sub_bucket = divmod(index, self.sub_buckets)
+        exponent += self.min_exponent
+        step = 1 / self.sub_buckets
+        return ldexp(1 + sub_bucket * step, exponent), ldexp(1 + (sub_bucket + 1) * step, exponent)
+
+    def record(self, value, weight=1.0):
+        """Records a value.
+
+        Positional arguments:
+        value -- the value (rate). Must not be negative.
+
+        Keyword arguments:
+        weight -- how much this value counts (e.g. number of seconds it lasted).
+        """
+        if value < 0:
+            raise ValueError('value cannot be negative.')
+        if value:
+            self._counts[self._index(value)] += weight
+        else:
+            self.zero += weight
+        self.total += weight
+        self._sum += value * weight
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def merge(self, other):
+        """Adds another histogram's values to this one, such as to combine the histograms of many progress bars.
+
+        Positional arguments:
+        other -- RateHistogram instance with the same sub_buckets, min_exponent, and max_exponent.
+        """
+        layout = (self.sub_buckets, self.min_exponent, self.max_exponent)
+        if layout != (other.sub_buckets, other.min_exponent, other.max_exponent):
+            raise ValueError('histograms have different layouts.')
+        counts = self._counts
+        for index, weight in enumerate(other._counts):
+            if weight:
+                counts[index] += weight
+        self.zero += other.zero
+        self.total += other.total
+        self._sum += other._sum
+        if other.minimum is not None and (self.minimum is None or other.minimum < self.minimum):
+            self.minimum = other.minimum
+        if other.maximum is not None and (self.maximum is None or other.maximum > self.maximum):
+            self.maximum = other.maximum
+
+    def clear(self):
+        """Forgets all values."""
+        self.__init__(self.sub_buckets, self.min_exponent, self.max_exponent)
+
+    @property
+    def mean(self):
+        """Returns the weighted mean of all values (exact). None if nothing was recorded."""
+        return self._sum / self.total if self.total else None
+
+    def buckets(self):
+        """Yields 3-item tuples (low, high, weight) of non-empty buckets, lowest first. 0 is yielded as (0, 0, w)."""
+        if self.zero:
+            yield 0.0, 0.0, self.zero
+        for index, weight in enumerate(self._counts):
+            if weight:
+                low, high = self._bounds(index)
+                yield low, high, weight
+
+    def percentile(self, percent):
+        """Returns the value below which `percent` of the weight falls (the middle of its bucket, within min/max).
+
+        0 and 100 return the exact minimum and maximum.
+
+        Positional arguments:
+        percent -- 0 to 100 (e.g. 50 for the median, 99 for p99).
+
+        Returns:
+        The value (float) or None if nothing was recorded.
+        """
+        if not self.total:
+            return None
+        if percent <= 0:
+            return self.minimum
+        if percent >= 100:
+            return self.maximum
+        target = self.total * percent / 100
+        cumulative = 0.0
+        for low, high, weight in self.buckets():
+            cumulative += weight
+            if cumulative >= target:
+                return min(max((low + high) / 2, self.minimum), self.maximum)
+        return self.maximum
@@ -0,0 +1,189 @@
+"""Optional counters measuring how much time is spent in etaprogress' hot paths.
+
+Disabled by default. enable() swaps the hot path functions for wrappers that count and time each call and disable()
+puts the originals back, so there is no cost at all when disabled (not even an `if`). Counted:
+
+calculate -- ETA._calculate() runs (rate and ETA calculations).
+generate_eta -- _generate_eta() calls of progress bars (ETA string generation).
+render -- __str__() calls of progress bars. Includes the time of the calls below made while rendering.
+terminal_width -- etaprogress.components.misc.query_terminal_width() calls (ioctl or win32 call).
+locale_format -- LocaleFormat.integer() and LocaleFormat.fixed() calls (etaprogress.components.locale_format).
+
+Each is counted process-wide and per instance. Per instance, calculate is counted on ETA instances and the others on
+the progress bar that was rendering (or setting its numerator) at the time. snapshot(progress_bar) includes the
+calculations of the progress bar's ETA instance. Counts are updated under a lock, so calls from many threads (e.g.
+progress bars updated through add() and sample()) are all counted.
+
+Example:
+    instrumentation.enable()
+    ...
+    stats = instrumentation.snapshot()
+    overhead = stats['render']['seconds'] / stats['wall_seconds']
+"""
+
+import threading
+import time
+
+from etaprogress import eta, progress
+from etaprogress.components import misc
+from etaprogress.components.locale_format import LocaleFormat
+
+NAMES = ('calculate', 'generate_eta', 'render', 'terminal_width', 'locale_format')
+TIMER = getattr(time, 'perf_counter', time.time)
+
+_ORIGINALS = list()  # 3-item tuples (owner, attribute name, original value) of everything swapped by enable().
+_STATE = dict(started=None, totals=dict())
+_LOCAL = threading.local()  # Holds the progress bar currently rendering in this thread.
+_LOCK = threading.Lock()  # Held while updating totals.
+
+
+def _count(name, seconds, instance=None):
+    """Adds a call to the process-wide totals and to the instance's own totals.
+
+    Positional arguments:
+    name -- one of NAMES.
+    seconds -- time the call took.
+
+    Keyword arguments:
+    instance -- ETA instance or progress bar to count the call on too.
+    """
+    with _LOCK:
+        totals = _STATE['totals'][name]
+        totals[0] += 1
+        totals[1] += seconds
+        if instance is None:
+            return
+        try:
+            totals = instance._instrumentation[name]
+        except AttributeError:
+            instance._instrumentation = dict((n, [0, 0.0]) for n in NAMES)
+            totals = instance._instrumentation[name]
+        totals[0] += 1
+        totals[1] += seconds
+
+
+def _swap(owner, attribute, replacement):
+    """Replaces an attribute, remembering the original for disable()."""
+    original = owner.__dict__[attribute] if isinstance(owner, type) else getattr(owner, attribute)
+    _ORIGINALS.append((owner, attribute, original))  # Class __dict__ keeps staticmethod objects intact.
+    setattr(owner, attribute, replacement)
+
+
+def _wrap_calculate(original):
+    """Returns a counted ETA._calculate()."""
+    def _calculate(self):
+        started = TIMER()
+        try:
+            return original(self)
+        finally:
+            _count('calculate', TIMER() - started, self)
+    return _calculate
+
+
+def _wrap_generate_eta(original):
+    """Returns a counted _generate_eta(). Becomes a regular method while enabled to know which instance called it."""
+    def _generate_eta(self, seconds):
+        started = TIMER()
+        try:
+            return original(seconds)
+        finally:
+            _count('generate_eta', TIMER() - started, self)
+    return _generate_eta
+
+
+def _wrap_str(original):
+    """Returns a counted __str__() which also makes the instance the current one for nested calls."""
+    def __str__(self):
+        previous, _LOCAL.instance = getattr(_LOCAL, 'instance', None), self
+        started = TIMER()
+        try:
+            return original(self)
+        finally:
+            _count('render', TIMER() - started, self)
+            _LOCAL.instance = previous
+    return __str__
+
+
+def _wrap_locale_format(original):
+    """Returns a counted LocaleFormat method."""
+    def method(self, *args, **kwargs):
+        started = TIMER()
+        try:
+            return original(self, *args, **kwargs)
+        finally:
+            _count('locale_format', TIMER() - started, getattr(_LOCAL, 'instance', None))
+    method.__name__ = original.__name__
+    return method
+
+
+def _wrap_terminal_width(original):
+    """Returns a counted query_terminal_width()."""
+    def query_terminal_width(fd=0):
+        started = TIMER()
+        try:
+            return original(fd)
+        finally:
+            _count('terminal_width', TIMER() - started, getattr(_LOCAL, 'instance', None))
+    return query_terminal_width
+
+
+def enabled():
+    """Returns True if instrumentation is enabled."""
+    return bool(_ORIGINALS)
+
+
+def enable():
+    """Starts counting. Resets all process-wide totals. Does nothing if already enabled."""
+    if _ORIGINALS:
+        return
+    reset()
+    _swap(eta.ETA, '_calculate', _wrap_calculate(eta.ETA._calculate))
+    for name in progress.__all__:
+        cls = getattr(progress, name)
+        if '__str__' in cls.__dict__:
+            _swap(cls, '__str__', _wrap_str(cls.__dict__['__str__']))
+        if '_generate_eta' in cls.__dict__:
+            function = cls.__dict__['_generate_eta'].__get__(None, cls)  # staticmethod has no __func__ before 2.7.
+            _swap(cls, '_generate_eta', _wrap_generate_eta(function))
+    _swap(misc, 'query_terminal_width', _wrap_terminal_width(misc.query_terminal_width))
+    for name in ('integer', 'fixed'):
+        _swap(LocaleFormat, name, _wrap_locale_format(LocaleFormat.__dict__[name]))
+
+
+def disable():
+    """Stops counting and puts the original functions back. Totals are kept until the next enable() or reset()."""
+    while _ORIGINALS:
+        owner, attribute, original = _ORIGINALS.pop()
+        setattr(owner, attribute, original)
+
+
+def reset():
+    """Resets all process-wide totals and the wall time they're measured against."""
+    with _LOCK:
+        _STATE['started'] = TIMER()
+        _STATE['totals'] = dict((n, [0, 0.0]) for n in NAMES)
+
+
+def snapshot(instance=None):
+    """Returns the totals as a new dictionary.
+
+    Keyword arguments:
+    instance -- return the totals of this ETA instance or progress bar instead of the process-wide ones.
+
+    Returns:
+    Dictionary with a key for each of NAMES, values are dictionaries with `count` and `seconds` keys. Process-wide
+        totals also have a `wall_seconds` key, seconds since enable() or reset().
+    """
+    if instance is None:
+        totals = _STATE['totals']
+    else:
+        totals = dict((n, list(t)) for n, t in getattr(instance, '_instrumentation', dict()).items())
+        own_eta = getattr(instance, '_eta', None)
+        for name, (count, seconds) in getattr(own_eta, '_instrumentation', dict()).items():
+            total = totals.setdefault(name, [0, 0.0])
+            total[0] += count
+            total[1] += seconds
+    stats = dict((n, dict(count=totals.get(n, (0, 0.0))[0], seconds=totals.get(n, (0, 0.0))[1])) for n in NAMES)
+    if instance is None:
+        stats['wall_seconds'] = TIMER() - _STATE['started'] if _STATE['started'] is not None else 0.0
+    return stats
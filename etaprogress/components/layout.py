@@ -0,0 +1,100 @@
+"""Compiles progress bar templates into segments so lines are built with one join instead of many str.format() calls."""
+
+from string import Formatter
+
+SHARES = dict(bar=0.6, filename=0.4)
+_FORMATTER = Formatter()
+
+
+class Layout(object):
+    """A str.format() style template split into fixed text and fields once, filled in on every render.
+
+    Flexible fields (the keys of `shares`, by default {bar} and {filename}) take up the width left over by everything
+    else. Each gets int(width * share) of it, except the last flexible field in the template which gets the rest. So
+    '{filename} {bar}' gives 40% to the file name and 60% to the bar, and '{bar}' alone gives everything to the bar.
+
+    Positional arguments:
+    template -- str.format() style template with named fields (e.g. '{percent:3d}% {bar} eta {eta}').
+
+    Keyword arguments:
+    shares -- dictionary of flexible field names and their share (0 to 1) of the left over width. Default is SHARES.
+
+    Instance variables:
+    template -- the template string.
+    shares -- dictionary of flexible field names and their share of the left over width.
+    names -- set of field names in the template (not counting ones nested in format specs).
+    _segments -- list of fixed text, with None where fields go.
+    _fields -- list of 5-item tuples (index in _segments, name, conversion, format spec, nested spec) of fields that
+        aren't flexible.
+    _flexible -- list of 2-item tuples (name, share) of flexible fields in the order they appear.
+    _positions -- dictionary of field names and lists of 2-item tuples (index in _segments, format spec).
+    _fixed_length -- number of characters taken up by fixed text.
+    """
+
+    def __init__(self, template, shares=None):
+        self.template = template
+        self.shares = dict(SHARES if shares is None else shares)
+        self.names = set()
+        self._segments = list()
+        self._fields = list()
+        self._flexible = list()
+        self._positions = dict()
+        for literal, name, spec, conversion in _FORMATTER.parse(template):
+            if literal:
+                self._segments.append(literal)
+            if name is None:
+                continue
+            if not name or name[0].isdigit():
+                raise ValueError('positional fields are not supported, use names.')
+            index = len(self._segments)
+            self._segments.append(None)
+            self.names.add(name)
+            self._positions.setdefault(name, list()).append((index, spec))
+            if name in self.shares:
+                self._flexible.append((name, self.shares[name]))
+            else:
+                self._fields.append((index, name, conversion, spec, '{' in spec))
+        self._fixed_length = sum(len(s) for s in self._segments if s is not None)
+
+    def fill(self, values, available):
+        """Fills in every field but flexible ones.
+
+        Positional arguments:
+        values -- dictionary of field names and their values (at least all non-flexible fields in the template).
+        available -- number of characters available for the whole line.
+
+        Returns:
+        2-item tuple: list of segments (None where flexible fields go, see put()) and a dictionary of flexible field
+            names and their widths.
+        """
+        segments = list(self._segments)
+        used = self._fixed_length
+        for index, name, conversion, spec, nested in self._fields:
+            value = values[name] if '.' not in name and '[' not in name else _FORMATTER.get_field(name, (), values)[0]
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            text = format(value, _FORMATTER.vformat(spec, (), values) if nested else spec)
+            segments[index] = text
+            used += len(text)
+
+        # Split the left over width between flexible fields.
+        width = available - used
+        widths = dict()
+        remaining = width
+        for name, share in self._flexible[:-1]:
+            widths[name] = int(width * share)
+            remaining -= widths[name]
+        if self._flexible:
+            widths[self._flexible[-1][0]] = remaining
+        return segments, widths
+
+    def put(self, segments, name, text):
+        """Puts text in all positions of a field in a list returned by fill(). Does nothing if the field isn't used.
+
+        Positional arguments:
+        segments -- list returned by fill().
+        name -- field name.
+        text -- string to put there (formatted with the field's format spec if any).
+        """
+        for index, spec in self._positions.get(name, ()):
+            segments[index] = format(text, spec) if spec else text
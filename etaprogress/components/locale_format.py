@@ -0,0 +1,159 @@
+"""Locale aware number formatting. Replaces locale.format() which is slow and was removed in Python 3.12."""
+
+from decimal import Decimal, ROUND_DOWN
+import locale
+
+try:
+    format(1000, ',d')
+except ValueError:  # Python 2.6.
+    _COMMA_SPEC = False
+else:
+    _COMMA_SPEC = True
+
+
+def truncate(value, digits):
+    """Truncates (rounds towards 0) a number to a number of decimal places as written by str().
+
+    Same as float(Decimal(str(value)).quantize(Decimal('.01'), rounding=ROUND_DOWN)) for 2 digits, without building
+    Decimal instances except for numbers str() writes in scientific notation.
+
+    Positional arguments:
+    value -- the number to truncate.
+    digits -- number of decimal places to keep.
+
+    Returns:
+    Float.
+    """
+    text = str(value)
+    if 'e' in text or 'n' in text:  # Scientific notation, inf, or nan.
+        return float(Decimal(text).quantize(Decimal(1).scaleb(-digits), rounding=ROUND_DOWN))
+    whole, _, fraction = text.partition('.')
+    return float(whole + '.' + fraction[:digits]) if fraction else float(whole)
+
+
+class LocaleFormat(object):
+    """Formats numbers like locale.format() did, with the locale's separators and grouping rules captured once.
+
+    Conventions are read from locale.localeconv() the first time they're needed, so instances may be created before
+    the program calls locale.setlocale(). Call refresh() if LC_NUMERIC changes after that.
+
+    When digits are grouped by threes (most locales) the built-in ',' format spec does the grouping in C and the
+    separators are swapped in afterwards. Other grouping rules (e.g. 3 then 2 for Indian English), and all rules on
+    Python 2.6 which lacks the ',' format spec, are applied to the digits string by group_digits().
+
+    Instance variables:
+    decimal_point -- decimal point character(s) of the locale.
+    thousands_sep -- thousands separator character(s) of the locale.
+    grouping -- localeconv()'s list of group sizes, rightmost first (0 repeats the previous size, CHAR_MAX stops).
+    _by_threes -- True if grouping is every 3 digits all the way.
+    _sizes -- tuple of group sizes before the repeated one.
+    _repeat -- size repeated after _sizes. None if grouping stops after them.
+    _swap -- True if the locale's separators differ from the ',' and '.' written by the ',' format spec.
+    """
+
+    CONVENTIONS = ('decimal_point', 'thousands_sep', 'grouping', '_by_threes', '_sizes', '_repeat', '_swap')
+
+    def __getattr__(self, item):
+        """Captures the locale's conventions the first time they're read."""
+        if item not in self.CONVENTIONS:
+            raise AttributeError(item)
+        self.refresh()
+        return getattr(self, item)
+
+    def refresh(self):
+        """Captures the current locale's conventions (decimal point, thousands separator, and grouping)."""
+        conventions = locale.localeconv()
+        self.decimal_point = conventions['decimal_point']
+        self.thousands_sep = conventions['thousands_sep']
+        self.grouping = list(conventions['grouping'])
+
+        # Split grouping into sizes and the repeated size.
+        sizes = list()
+        self._repeat = None
+        for size in self.grouping:
+            if size == locale.CHAR_MAX:
+                break
+            if size == 0:
+                self._repeat = sizes[-1] if sizes else None
+                break
+            sizes.append(size)
+        self._sizes = tuple(sizes)
+        self._by_threes = _COMMA_SPEC and self._repeat == 3 and all(s == 3 for s in sizes)
+        self._swap = self.thousands_sep != ',' or self.decimal_point != '.'
+
+    def _localize(self, formatted):
+        """Replaces ',' and '.' written by the ',' format spec with the locale's separators.
+
+        str.translate() would do it in one pass but takes different arguments on Python 2 and 3. The thousands
+        separators go through a placeholder in case the locale's decimal point is ','.
+        """
+        if not self._swap:
+            return formatted
+        return formatted.replace(',', '\0').replace('.', self.decimal_point).replace('\0', self.thousands_sep)
+
+    def group_digits(self, digits):
+        """Inserts thousands separators into a string of digits (with an optional leading minus sign).
+
+        Positional arguments:
+        digits -- string of digits (e.g. '1234567').
+
+        Returns:
+        String (e.g. '1,234,567').
+        """
+        sign = ''
+        if digits[:1] == '-':
+            sign, digits = '-', digits[1:]
+        groups = list()
+        sizes = self._sizes
+        index = 0
+        while True:
+            if index < len(sizes):
+                size = sizes[index]
+            elif self._repeat:
+                size = self._repeat
+            else:
+                break
+            if len(digits) <= size:
+                break
+            groups.append(digits[-size:])
+            digits = digits[:-size]
+            index += 1
+        groups.append(digits)
+        groups.reverse()
+        return sign + self.thousands_sep.join(groups)
+
+    def integer(self, value, grouping=True):
+        """Returns the number formatted like locale.format('%d', value, grouping=grouping).
+
+        Positional arguments:
+        value -- the number. Floats are truncated like '%d' does.
+
+        Keyword arguments:
+        grouping -- insert thousands separators.
+        """
+        if not grouping or not self._sizes:
+            return '%d' % value
+        if self._by_threes:
+            return self._localize(format(int(value), ',d'))
+        return self.group_digits('%d' % value)
+
+    def fixed(self, value, digits, grouping=False):
+        """Returns the number formatted like locale.format('%.<digits>f', value, grouping=grouping).
+
+        Positional arguments:
+        value -- the number.
+        digits -- number of decimal places.
+
+        Keyword arguments:
+        grouping -- insert thousands separators.
+        """
+        if grouping and self._by_threes:
+            return self._localize(format(value, ',.%df' % digits))
+        formatted = '%.*f' % (digits, value)
+        if grouping and self._sizes and formatted[-1:].isdigit():  # Not inf or nan.
+            whole, point, fraction = formatted.partition('.')
+            return self.group_digits(whole) + (self.decimal_point if point else '') + fraction
+        return formatted.replace('.', self.decimal_point) if self.decimal_point != '.' else formatted
+
+
+LOCALE = LocaleFormat()
@@ -3,6 +3,7 @@
 import ctypes
 from itertools import cycle
 import os
+import signal
 import struct
 import time
 if os.name != 'nt':
@@ -12,9 +13,12 @@ else:
     import ctypes.wintypes
 
 DEFAULT_TERMINAL_WIDTH = None
-NOW = time.time
+NOW = getattr(time, 'monotonic', time.time)
+POLL_INTERVAL = 1.0  # Seconds between terminal width queries unless watch_resize() is used.
 SPINNER = cycle(('/', '-', '\\', '|'))
 
+_WIDTH_CACHE = dict(fd=0, width=None, checked=0.0, watching=False, previous_handler=None)
+
 
 class _WindowsCSBI(object):
     """Interfaces with Windows CONSOLE_SCREEN_BUFFER_INFO API/DLL calls. Gets info for stderr and stdout.
@@ -120,17 +124,101 @@ class _WindowsCSBI(object):
         return result
 
 
-def terminal_width():
-    """Returns the terminal's width (number of character columns)."""
+def query_terminal_width(fd=0):
+    """Returns the terminal's width (number of character columns) by asking the terminal (one ioctl/win32 call).
+
+    Keyword arguments:
+    fd -- file descriptor of the terminal to query: 0 for stdin, 1 for stdout, 2 for stderr. On Windows, stderr's
+        console if 2 and stdout's otherwise.
+
+    Returns:
+    Integer, 80 if it's not a terminal.
+    """
     try:
         if os.name == 'nt':
             _WindowsCSBI.initialize()
-            return _WindowsCSBI.get_info(_WindowsCSBI.HANDLE_STDOUT)['terminal_width']
-        return struct.unpack('hhhh', fcntl.ioctl(0, termios.TIOCGWINSZ, '\000' * 8))[1]
+            handle = _WindowsCSBI.HANDLE_STDERR if fd == 2 else _WindowsCSBI.HANDLE_STDOUT
+            return _WindowsCSBI.get_info(handle)['terminal_width']
+        return struct.unpack('hhhh', fcntl.ioctl(fd, termios.TIOCGWINSZ, '\000' * 8))[1]
     except IOError:
         return 80
 
 
+def _on_sigwinch(signum, frame):
+    """SIGWINCH handler. Clears the cached terminal width then calls the previously installed handler (if any)."""
+    _WIDTH_CACHE['width'] = None
+    previous_handler = _WIDTH_CACHE['previous_handler']
+    if callable(previous_handler):
+        previous_handler(signum, frame)
+
+
+def _watch_sigwinch():
+    """Installs the SIGWINCH handler. Returns False if not possible (Windows or not in the main thread)."""
+    if not hasattr(signal, 'SIGWINCH'):
+        return False
+    if signal.getsignal(signal.SIGWINCH) is _on_sigwinch:
+        return True  # Already installed, don't chain to ourselves.
+    try:
+        _WIDTH_CACHE['previous_handler'] = signal.signal(signal.SIGWINCH, _on_sigwinch)
+    except ValueError:
+        return False
+    return True
+
+
+def set_terminal_fd(fd):
+    """Selects which file descriptor terminal_width() queries (e.g. 1 for stdout or 2 for stderr, default is 0).
+
+    Positional arguments:
+    fd -- file descriptor, see query_terminal_width().
+    """
+    _WIDTH_CACHE['fd'] = fd
+    _WIDTH_CACHE['width'] = None
+
+
+def watch_resize():
+    """Installs a SIGWINCH handler which clears terminal_width()'s cache when the terminal is resized. Opt-in.
+
+    Call from the main thread. Not done by default since the signal interrupts blocking system calls (EINTR) on Python
+    2 and 3.3/3.4, which programs may not expect. A previously installed handler is still called. If another handler
+    replaces this one later, terminal_width() notices and goes back to polling.
+
+    Returns:
+    True if the handler is installed, False if not possible (Windows or not in the main thread).
+    """
+    _WIDTH_CACHE['watching'] = _watch_sigwinch()
+    return _WIDTH_CACHE['watching']
+
+
+def terminal_width():
+    """Returns the terminal's width (number of character columns). Cached process-wide.
+
+    The terminal is queried again at most every POLL_INTERVAL seconds, or only after it's resized with watch_resize().
+    """
+    cache = _WIDTH_CACHE
+    now = NOW()
+    if cache['width'] is None or now - cache['checked'] >= POLL_INTERVAL:
+        if cache['watching'] and signal.getsignal(signal.SIGWINCH) is not _on_sigwinch:
+            cache['watching'] = False  # Replaced by another handler, poll instead.
+        if cache['width'] is None or not cache['watching']:
+            cache['width'] = query_terminal_width(cache['fd'])
+        cache['checked'] = now
+    return cache['width']
+
+
+def get_available_width(max_terminal_width=None):
+    """Returns the number of characters available for the whole progress bar.
+
+    Keyword arguments:
+    max_terminal_width -- limit the overall width of everything to these many characters.
+
+    Returns:
+    Integer.
+    """
+    if max_terminal_width is not None:
+        return min(terminal_width(), max_terminal_width)
+    return terminal_width()
+
+
 def get_remaining_width(sample_string, max_terminal_width=None):
     """Returns the number of characters available if sample string were to be printed in the terminal.
 
@@ -143,8 +231,4 @@ def get_remaining_width(sample_string, max_terminal_width=None):
     Returns:
     Integer.
     """
-    if max_terminal_width is not None:
-        available_width = min(terminal_width(), max_terminal_width)
-    else:
-        available_width = terminal_width()
-    return available_width - len(sample_string)
+    return get_available_width(max_terminal_width) - len(sample_string)
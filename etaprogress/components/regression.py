@@ -0,0 +1,129 @@
+"""Simple linear regression over a sliding window of data points, updated in constant time."""
+
+from __future__ import division
+
+from math import sqrt
+
+
+class LinearRegression(object):
+    """Keeps running sums of x, y, xy, x^2, and y^2 so the regression line is available without walking the data.
+
+    Points are added when they enter the window and removed when they leave it. All sums are kept relative to an
+    origin (the first point added since the last clear/reset) so large values (e.g. Unix timestamps or byte counts)
+    don't lose precision when squared.
+
+    Instance variables:
+    n -- number of points currently in the window.
+    origin -- 2-item tuple (x, y) all sums are relative to.
+    sum_x -- sum of x values (relative to origin).
+    sum_y -- sum of y values (relative to origin).
+    sum_xy -- sum of x * y values (relative to origin).
+    sum_xx -- sum of x^2 values (relative to origin).
+    sum_yy -- sum of y^2 values (relative to origin).
+    """
+
+    def __init__(self, points=()):
+        self.n = 0
+        self.origin = (0.0, 0.0)
+        self.sum_x = self.sum_y = self.sum_xy = self.sum_xx = self.sum_yy = 0.0
+        self.reset(points)
+
+    def reset(self, points=()):
+        """Clears all sums and rebuilds them from scratch. Also used to cancel out accumulated floating point drift.
+
+        Keyword arguments:
+        points -- iterable of 2-item tuples (x, y) to add after clearing.
+        """
+        self.n = 0
+        self.sum_x = self.sum_y = self.sum_xy = self.sum_xx = self.sum_yy = 0.0
+        for x, y in points:
+            self.add(x, y)
+
+    def reset_columns(self, x, y):
+        """Same as reset() but from two NumPy arrays (x values and y values). Sums are computed with vectorized math.
+
+        Positional arguments:
+        x -- NumPy array of x values.
+        y -- NumPy array of y values, same length as x.
+        """
+        self.reset()
+        if not len(x):
+            return
+        self.origin = (float(x[0]), float(y[0]))
+        x = x - self.origin[0]
+        y = y - self.origin[1]
+        self.n = len(x)
+        self.sum_x = float(x.sum())
+        self.sum_y = float(y.sum())
+        self.sum_xy = float(x.dot(y))
+        self.sum_xx = float(x.dot(x))
+        self.sum_yy = float(y.dot(y))
+
+    def add(self, x, y):
+        """Adds a point to the window."""
+        if not self.n:
+            self.origin = (x, y)
+        x -= self.origin[0]
+        y -= self.origin[1]
+        self.n += 1
+        self.sum_x += x
+        self.sum_y += y
+        self.sum_xy += x * y
+        self.sum_xx += x * x
+        self.sum_yy += y * y
+
+    def remove(self, x, y):
+        """Removes a point previously added to the window."""
+        x -= self.origin[0]
+        y -= self.origin[1]
+        self.n -= 1
+        self.sum_x -= x
+        self.sum_y -= y
+        self.sum_xy -= x * y
+        self.sum_xx -= x * x
+        self.sum_yy -= y * y
+
+    @property
+    def mean_x(self):
+        """Returns the mean of x values (relative to origin)."""
+        return self.sum_x / self.n
+
+    @property
+    def mean_y(self):
+        """Returns the mean of y values (relative to origin)."""
+        return self.sum_y / self.n
+
+    @property
+    def ss_xx(self):
+        """Returns the sum of squared deviations of x from its mean."""
+        return max(self.sum_xx - self.sum_x * self.sum_x / self.n, 0.0)
+
+    @property
+    def ss_yy(self):
+        """Returns the sum of squared deviations of y from its mean."""
+        return max(self.sum_yy - self.sum_y * self.sum_y / self.n, 0.0)
+
+    @property
+    def ss_xy(self):
+        """Returns the sum of the products of x and y deviations from their means."""
+        return self.sum_xy - self.sum_x * self.sum_y / self.n
+
+    @property
+    def slope(self):
+        """Returns the slope of the regression line (same as Pearson's r * (std_y / std_x)). 0.0 if undefined."""
+        ss_xx = self.ss_xx
+        return self.ss_xy / ss_xx if ss_xx else 0.0
+
+    @property
+    def slope_error(self):
+        """Returns the standard error of the slope. None if undefined (less than 3 points or all x values are equal)."""
+        ss_xx = self.ss_xx
+        if self.n < 3 or not ss_xx:
+            return None
+        residual_variance = max(self.ss_yy - self.slope * self.ss_xy, 0.0) / (self.n - 2)
+        return sqrt(residual_variance / ss_xx)
+
+    @property
+    def intercept(self):
+        """Returns the y-intercept of the regression line (relative to origin)."""
+        return self.mean_y - self.slope * self.mean_x
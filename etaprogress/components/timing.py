@@ -0,0 +1,202 @@
+"""Containers holding ETA timing data (timestamp and numerator pairs)."""
+
+from array import array
+from collections import deque
+
+NUMPY_THRESHOLD = 10000  # ETA scopes this large or larger use TimingNumpy automatically if NumPy is installed.
+
+
+def import_numpy():
+    """Returns the numpy module or None if it's not installed. Only imported when needed, it's slow to import."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class TimingDeque(deque):
+    """Default timing data container. A deque of 2-item tuples (x, y) with a few methods shared with TimingRingBuffer.
+
+    x is the timestamp, y is the numerator. Limited to `maxlen` entries. Once this limit is reached, any new entry
+    pushes off the oldest one.
+    """
+
+    def push(self, x, y):
+        """Appends a new entry."""
+        self.append((x, y))
+
+    def replace_last(self, x, y):
+        """Overwrites the newest entry."""
+        self[-1] = (x, y)
+
+    def x_at(self, index):
+        """Returns the timestamp of an entry."""
+        return self[index][0]
+
+    def y_at(self, index):
+        """Returns the numerator of an entry."""
+        return self[index][1]
+
+
+class TimingRingBuffer(object):
+    """Compact timing data container. Behaves like TimingDeque but stores entries in two preallocated arrays of doubles.
+
+    No objects are allocated when pushing or replacing entries, which keeps memory usage and garbage collector churn
+    down when there are many ETA instances or large scopes. Numerators are stored as floats, except the newest one which
+    is also kept as given (e.g. int), so ETA.numerator returns the same type and value as with TimingDeque (integers
+    above 2 ** 53 don't lose precision).
+
+    Positional arguments:
+    iterable -- initial 2-item tuples (x, y) to push.
+    maxlen -- number of entries to hold. Once reached, any new entry pushes off the oldest one.
+
+    Instance variables:
+    maxlen -- number of entries to hold.
+    _x -- array of timestamps.
+    _y -- array of numerators.
+    _head -- index in the arrays of the oldest entry.
+    _length -- number of entries currently held.
+    _last_y -- the newest numerator as given to push() or replace_last().
+    """
+
+    def __init__(self, iterable=(), maxlen=60):
+        if not maxlen or maxlen < 1:
+            raise ValueError('maxlen must be a positive integer.')
+        self.maxlen = maxlen
+        self._x = self._column(maxlen)
+        self._y = self._column(maxlen)
+        self._head = 0
+        self._length = 0
+        self._last_y = None
+        for x, y in iterable:
+            self.push(x, y)
+
+    def __len__(self):
+        """Returns the number of entries."""
+        return self._length
+
+    def __iter__(self):
+        """Yields 2-item tuples (x, y) from oldest to newest."""
+        for i in range(self._length):
+            position = (self._head + i) % self.maxlen
+            yield self._x[position], self._y_at_position(position)
+
+    def __getitem__(self, index):
+        """Returns an entry as a 2-item tuple (x, y). Negative indexes count from the newest entry."""
+        position = self._position(index)
+        return self._x[position], self._y_at_position(position)
+
+    def __setitem__(self, index, value):
+        """Overwrites an entry with a 2-item tuple (x, y)."""
+        position = self._position(index)
+        self._x[position], self._y[position] = value
+        if position == (self._head + self._length - 1) % self.maxlen:
+            self._last_y = value[1]
+
+    def __repr__(self):
+        """Represents the instance like a deque."""
+        return '{0}({1!r}, maxlen={2})'.format(self.__class__.__name__, list(self), self.maxlen)
+
+    @staticmethod
+    def _column(maxlen):
+        """Returns a new preallocated array of doubles."""
+        return array('d', [0.0]) * maxlen
+
+    def _position(self, index):
+        """Converts an entry index into an array index. Raises IndexError if out of range."""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('{0} index out of range'.format(self.__class__.__name__))
+        return (self._head + index) % self.maxlen
+
+    def _y_at_position(self, position):
+        """Returns the numerator at an array index, as given if it's the newest one."""
+        if position == (self._head + self._length - 1) % self.maxlen:
+            return self._last_y
+        return self._y[position]
+
+    def push(self, x, y):
+        """Appends a new entry, overwriting the oldest one if full."""
+        if self._length == self.maxlen:
+            position = self._head
+            self._head = (self._head + 1) % self.maxlen
+        else:
+            position = (self._head + self._length) % self.maxlen
+            self._length += 1
+        self._x[position] = x
+        self._y[position] = y
+        self._last_y = y
+
+    def popleft(self):
+        """Removes and returns the oldest entry (y as given if it was the only entry)."""
+        if not self._length:
+            raise IndexError('pop from an empty {0}'.format(self.__class__.__name__))
+        position = self._head
+        y = self._y_at_position(position)
+        self._head = (self._head + 1) % self.maxlen
+        self._length -= 1
+        return self._x[position], y
+
+    def replace_last(self, x, y):
+        """Overwrites the newest entry."""
+        position = self._position(-1)
+        self._x[position] = x
+        self._y[position] = y
+        self._last_y = y
+
+    def x_at(self, index):
+        """Returns the timestamp of an entry."""
+        return self._x[self._position(index)]
+
+    def y_at(self, index):
+        """Returns the numerator of an entry, as given for the newest one."""
+        return self._y_at_position(self._position(index))
+
+
+class TimingNumpy(TimingRingBuffer):
+    """Same as TimingRingBuffer but backed by NumPy arrays, for very large scopes (see NUMPY_THRESHOLD).
+
+    Single entries are accessed at about the same speed as TimingRingBuffer, but columns() exposes all entries as
+    arrays so the estimator can rebuild its running sums with vectorized operations instead of a Python loop (which
+    stalls the update that triggers it for tens of milliseconds with a scope of 100,000).
+
+    Instance variables are the same as etaprogress.components.timing.TimingRingBuffer.
+    """
+
+    def __getitem__(self, index):
+        """Returns an entry as a 2-item tuple (x, y) of Python floats (y as given for the newest entry)."""
+        position = self._position(index)
+        return float(self._x[position]), self._y_at_position(position)
+
+    def _y_at_position(self, position):
+        """Returns the numerator at an array index, as given if it's the newest one."""
+        if position == (self._head + self._length - 1) % self.maxlen:
+            return self._last_y
+        return float(self._y[position])
+
+    @staticmethod
+    def _column(maxlen):
+        """Returns a new preallocated NumPy array of doubles."""
+        numpy = import_numpy()
+        if numpy is None:
+            raise ImportError('NumPy is not installed.')
+        return numpy.zeros(maxlen)
+
+    def popleft(self):
+        """Removes and returns the oldest entry as Python floats (y as given if it was the only entry)."""
+        x, y = super(TimingNumpy, self).popleft()
+        return float(x), y
+
+    def x_at(self, index):
+        """Returns the timestamp of an entry as a Python float (NumPy scalars are slow in regular arithmetic)."""
+        return float(self._x[self._position(index)])
+
+    def columns(self):
+        """Returns two NumPy arrays (timestamps and numerators) of all entries, oldest first."""
+        start, end = self._head, self._head + self._length
+        if end <= self.maxlen:
+            return self._x[start:end], self._y[start:end]
+        concatenate, end = import_numpy().concatenate, end - self.maxlen
+        return concatenate((self._x[start:], self._x[:end])), concatenate((self._y[start:], self._y[:end]))
@@ -1,4 +1,68 @@
-"""Holds classes for handling unit conversions."""
+"""Holds classes and functions for handling unit conversions."""
+
+from bisect import bisect_right
+
+
+def _table(units, base, threshold_base=None):
+    """Returns a unit table for scale().
+
+    Positional arguments:
+    units -- unit names, smallest first, each `base` times larger than the previous one.
+    base -- 1000 or 1024.
+
+    Keyword arguments:
+    threshold_base -- switch to the next unit at powers of this instead of powers of base.
+
+    Returns:
+    3-item tuple: thresholds (smallest value shown in each unit but the first), divisors, and unit names.
+    """
+    thresholds = tuple((threshold_base or base) ** power for power in range(1, len(units)))
+    divisors = (1, ) + tuple(float(base ** power) for power in range(1, len(units)))
+    return thresholds, divisors, tuple(units)
+
+
+BITS = _table(('b', 'kb', 'mb', 'gb', 'tb'), 1000)
+BYTES = _table(('B', 'KiB', 'MiB', 'GiB', 'TiB'), 1024)
+BYTES_NO_THOUSANDS = _table(('B', 'KiB', 'MiB', 'GiB', 'TiB'), 1024, 1000)  # Next unit before showing 4 digits.
+BYTES_SI = _table(('B', 'kB', 'MB', 'GB', 'TB'), 1000)
+
+
+def scale(value, table=BYTES, unit=None):
+    """Converts a number of bits/bytes into the highest whole-number unit (or into a specific unit).
+
+    Same results as UnitBit/UnitByte's properties, without creating instances. The unit is found by a binary search
+    of the table's thresholds.
+
+    Positional arguments:
+    value -- number of bits/bytes.
+
+    Keyword arguments:
+    table -- one of BITS, BYTES, BYTES_NO_THOUSANDS, or BYTES_SI.
+    unit -- convert into this unit of the table instead (e.g. 'MiB').
+
+    Returns:
+    2-item tuple, the converted value and the name of the unit. The value is returned as is in the smallest unit.
+    """
+    thresholds, divisors, units = table
+    index = bisect_right(thresholds, value) if unit is None else units.index(unit)
+    return (value / divisors[index] if index else value), units[index]
+
+
+def scale_many(values, table=BYTES):
+    """Converts many numbers at once (e.g. every transfer shown on a dashboard). Each gets its own unit.
+
+    Positional arguments:
+    values -- iterable of numbers of bits/bytes.
+
+    Keyword arguments:
+    table -- one of BITS, BYTES, BYTES_NO_THOUSANDS, or BYTES_SI.
+
+    Returns:
+    List of 2-item tuples like scale() returns.
+    """
+    thresholds, divisors, units = table
+    indexes = ((v, bisect_right(thresholds, v)) for v in values)
+    return [((v / divisors[i] if i else v), units[i]) for v, i in indexes]
 
 
 class UnitBit(object):
@@ -35,16 +99,7 @@ class UnitBit(object):
     @property
     def auto(self):
         """Returns the highest whole-number unit."""
-        if self._value >= 1000000000000:
-            return self.tb, 'tb'
-        if self._value >= 1000000000:
-            return self.gb, 'gb'
-        if self._value >= 1000000:
-            return self.mb, 'mb'
-        if self._value >= 1000:
-            return self.kb, 'kb'
-        else:
-            return self.b, 'b'
+        return scale(self._value, BITS)
 
 
 class UnitByte(object):
@@ -81,27 +136,9 @@ class UnitByte(object):
     @property
     def auto(self):
         """Returns the highest whole-number unit."""
-        if self._value >= 1099511627776:
-            return self.TiB, 'TiB'
-        if self._value >= 1073741824:
-            return self.GiB, 'GiB'
-        if self._value >= 1048576:
-            return self.MiB, 'MiB'
-        if self._value >= 1024:
-            return self.KiB, 'KiB'
-        else:
-            return self.B, 'B'
+        return scale(self._value, BYTES)
 
     @property
     def auto_no_thousands(self):
         """Like self.auto but calculates the next unit if >999.99."""
-        if self._value >= 1000000000000:
-            return self.TiB, 'TiB'
-        if self._value >= 1000000000:
-            return self.GiB, 'GiB'
-        if self._value >= 1000000:
-            return self.MiB, 'MiB'
-        if self._value >= 1000:
-            return self.KiB, 'KiB'
-        else:
-            return self.B, 'B'
+        return scale(self._value, BYTES_NO_THOUSANDS)
@@ -5,53 +5,217 @@ https://pypi.python.org/pypi/etaprogress
 """
 
 from __future__ import division
-from collections import deque
-from math import sqrt
+import struct
+import threading
 import time
 
-__all__ = ('ETA', )
-_NOW = time.time  # For testing.
+from etaprogress.components.counters import ShardedCounter
+from etaprogress.components.estimators import EstimatorRegression
+from etaprogress.components.timing import import_numpy, NUMPY_THRESHOLD, TimingDeque, TimingNumpy, TimingRingBuffer
+
+__all__ = ('ETA', 'ETAGroup')
+_NOW = getattr(time, 'monotonic', time.time)  # Default clock. Immune to system clock changes (NTP, DST, etc).
+_WALL = time.time  # For converting clock times into wall times.
+_COUNTER_LOCK = threading.Lock()  # Held while creating default counters, so concurrent add() calls share one.
+_STATE_HEADER = struct.Struct('<4sBIddd')  # Magic, version, entries, denominator, elapsed, _progress_time.
+_STATE_MAGIC = b'ETAP'
+_STATE_VERSION = 1
+
+
+def _unpack_state(data):
+    """Validates a binary string returned by ETA.to_bytes() and unpacks its header.
+
+    Positional arguments:
+    data -- binary string returned by ETA.to_bytes().
+
+    Returns:
+    4-item tuple: number of entries, denominator, elapsed seconds, and _progress_time.
+    """
+    if len(data) < _STATE_HEADER.size:
+        raise ValueError('invalid ETA state.')
+    magic, version, count, denominator, elapsed, progress_time = _STATE_HEADER.unpack_from(data)
+    if magic != _STATE_MAGIC or version != _STATE_VERSION or len(data) != _STATE_HEADER.size + count * 16:
+        raise ValueError('invalid ETA state.')
+    return count, denominator, elapsed, progress_time
 
 
 class ETA(object):
-    """Calculates the estimated time remaining using Simple Linear Regression.
+    """Calculates the estimated time remaining using Simple Linear Regression (by default).
 
     If `denominator` is 0 or None, no ETA will be available.
 
     Keyword arguments:
     denominator -- the final/total number of units (like the expected file size of a download). 0 if unknown.
     scope -- used up to these many recent numerator entries to calculate the rate and ETA. Default is 60.
+    compact -- store timing data in two preallocated arrays instead of a deque of tuples. Uses less memory and doesn't
+        allocate on every update, but numerators other than the latest one are stored as floats.
+    use_numpy -- store timing data in NumPy arrays (like compact) so the estimator can rebuild its running sums with
+        vectorized math. None (default) to do so automatically if NumPy is installed and scope is at least
+        etaprogress.components.timing.NUMPY_THRESHOLD.
+    window_seconds -- only use entries up to these many seconds old to calculate the rate and ETA (the latest two are
+        always kept). Updates arriving faster than the window can hold are coalesced so no more than `scope` entries
+        are kept no matter the update frequency. None (default) to only limit by `scope`.
+    estimator -- instance of a etaprogress.components.estimators.BaseEstimator subclass used to calculate the rate and
+        ETA. One instance per ETA. Default is EstimatorRegression (simple linear regression over the window).
+    clock -- callable returning the current time in seconds (float). Default is time.monotonic (time.time if not
+        available). Use eta_wall_epoch to get the ETA as wall time regardless of clock.
+    lazy -- don't calculate the rate and ETA when setting the numerator, only mark them as outdated. They're calculated
+        the next time rate, eta_epoch, eta_seconds, etc. are read. Useful when updates are far more frequent than reads.
+    min_interval -- hold back numerators set less than these many seconds after the latest entry instead of adding
+        them. Only the latest held back numerator is kept (numerator returns it) and it's added by the next update past
+        the interval, by flush(), or when the rate, ETA, or elapsed time are read after the interval passes. Numerators
+        reaching the denominator are always added. None (default) to add all.
+    counter -- counter used by add() and sample(), an object with an add(delta) method and a value property. Default is
+        a new etaprogress.components.counters.ShardedCounter instance, created the first time it's used.
+    stall_threshold -- consider progress stalled when the numerator hasn't increased for these many seconds. Past that,
+        rate decays (multiplied by stall_threshold / seconds_since_progress) and eta_epoch moves back accordingly when
+        they're read. None (default) to only consider progress stalled when the rate is 0.
+    histogram -- etaprogress.components.histogram.RateHistogram instance to record the rate between every two
+        consecutive entries in, weighted by the number of seconds between them. None (default) to not record rates.
 
     Instance variables:
-    eta_epoch -- expected time (seconds since Unix epoch or time.time()) of completion (float).
+    counter -- counter incremented by add() and read by sample().
+    histogram -- RateHistogram instance or None.
+    eta_epoch -- expected time of completion (float) in the clock's time base (seconds since Unix epoch if time.time).
     rate -- current rate of progress (float).
-    _start_time -- used to derive the amount of time everything took to reach 100%.
-    _timing_data -- deque instance holding timing data. Similar to a list. Items are 2-item tuples, first item (x) is
-        time.time(), second item (y) is the numerator. Limited to `scope` to base ETA on. Once this limit is reached,
-        any new numerator item pushes off the oldest entry from the deque instance.
+    _counter -- counter instance. None until the default one is created by the first add() or sample() call.
+    _start_time -- clock time when the instance was created. Timing data is stored relative to this.
+    _clock -- clock callable. None to use the module's default (looked up every time, for testing).
+    _stale -- True if lazy and the rate and ETA haven't been calculated since the latest entry was added.
+    _pending -- 2-item tuple (x, y) of the numerator held back by min_interval. None if there isn't one.
+    _progress_time -- time (relative to _start_time) the numerator last increased or was first set.
+    _timing_data -- TimingDeque (TimingRingBuffer if compact, TimingNumpy if use_numpy) instance holding timing data.
+        Items are 2-item tuples, first item (x) is the number of seconds since _start_time, second item (y) is the
+        numerator. Keeping x small avoids losing precision when squaring it in the regression. Limited to `scope` to
+        base ETA on. Once this limit is reached, any new numerator item pushes off the oldest entry.
+    _estimator -- estimator instance, fed entries as they come and go from _timing_data.
+    _removals -- number of entries pushed off _timing_data since _estimator was last resynced.
+    _window_spacing -- with window_seconds, an entry closer than this to the one before the latest replaces the latest.
+    _group -- ETAGroup instance this instance is a child of, notified after every update. None if not in a group.
     """
 
-    def __init__(self, denominator=0, scope=60):
+    def __init__(self, denominator=0, scope=60, compact=False, window_seconds=None, estimator=None, use_numpy=None,
+                 clock=None, lazy=False, counter=None, min_interval=None, stall_threshold=None, histogram=None):
+        self._counter = counter
         self.denominator = denominator
-        self.eta_epoch = None
-        self.rate = 0.0
+        self.histogram = histogram
+        self.lazy = lazy
+        self.min_interval = min_interval
+        self.stall_threshold = stall_threshold
+        self.window_seconds = window_seconds
+
+        self._eta_epoch = None
+        self._rate = 0.0
+        self._stale = False
+        self._pending = None
+        self._progress_time = 0.0
+
+        self._window_spacing = 2.0 * window_seconds / scope if window_seconds and scope else 0.0
+
+        self._clock = clock
+        self._group = None
+        self._start_time = self._now()
+        self._estimator = EstimatorRegression() if estimator is None else estimator
+        self._removals = 0
+        if use_numpy is None:
+            use_numpy = scope is not None and scope >= NUMPY_THRESHOLD and import_numpy() is not None
+        if use_numpy:
+            self._timing_data = TimingNumpy(maxlen=scope)
+        elif compact:
+            self._timing_data = TimingRingBuffer(maxlen=scope)
+        else:
+            self._timing_data = TimingDeque(maxlen=scope)
+
+    @property
+    def _timing_data(self):
+        """Returns the container holding timing data."""
+        return self._timing_store
+
+    @_timing_data.setter
+    def _timing_data(self, value):
+        """Replaces the timing data and resets the estimator with it. Plain deques/iterables are converted."""
+        if not isinstance(value, (TimingDeque, TimingRingBuffer)):
+            value = TimingDeque(value, getattr(value, 'maxlen', None))
+        self._timing_store = value
+        self._estimator.reset(value)
+        self._removals = 0
+
+    @property
+    def eta_epoch(self):
+        """Returns the expected time of completion or None if there is no data yet. Decays past stall_threshold."""
+        if self._pending is not None:
+            self._settle()
+        if self._stale:
+            self._refresh()
+        if self.stall_threshold and self._eta_epoch is not None:
+            decay = self._decay()
+            if decay < 1.0 and self._rate > 0:
+                remaining = self.denominator - self.numerator
+                return self._start_time + self._progress_time + remaining / (self._rate * decay)
+        return self._eta_epoch
+
+    @eta_epoch.setter
+    def eta_epoch(self, value):
+        """Overrides the expected time of completion."""
+        self._eta_epoch = value
 
-        self._start_time = _NOW()
-        self._timing_data = deque(maxlen=scope)
+    @property
+    def counter(self):
+        """Returns the counter used by add() and sample(), creating the default one first if needed."""
+        if self._counter is None:
+            with _COUNTER_LOCK:
+                if self._counter is None:
+                    self._counter = ShardedCounter()
+        return self._counter
+
+    @counter.setter
+    def counter(self, value):
+        """Sets the counter used by add() and sample()."""
+        self._counter = value
+
+    @property
+    def rate(self):
+        """Returns the current rate of progress (float). Decays past stall_threshold."""
+        if self._pending is not None:
+            self._settle()
+        if self._stale:
+            self._refresh()
+        if self.stall_threshold:
+            return self._rate * self._decay()
+        return self._rate
+
+    @rate.setter
+    def rate(self, value):
+        """Overrides the current rate of progress."""
+        self._rate = value
 
     @property
     def numerator(self):
-        """Returns the latest numerator."""
-        return self._timing_data[-1][1] if self._timing_data else 0
+        """Returns the latest numerator (including one held back by min_interval)."""
+        if self._pending is not None:
+            return self._pending[1]
+        return self._timing_data.y_at(-1) if self._timing_data else 0
 
     @numerator.setter
     def numerator(self, value):
         """Sets a new numerator (adds to timing data table). Must be greater than or equal to previous numerator."""
         self.set_numerator(value)
 
+    @property
+    def pending(self):
+        """Returns True if a numerator is being held back by min_interval."""
+        return self._pending is not None
+
+    @property
+    def seconds_since_progress(self):
+        """Returns the number of seconds since the numerator last increased (or since the start if it never was set)."""
+        return self._now() - self._start_time - self._progress_time
+
     @property
     def stalled(self):
-        """Returns True if the rate is 0."""
+        """Returns True if the rate is 0 or if the numerator hasn't increased for stall_threshold seconds."""
+        if self.stall_threshold and self.seconds_since_progress >= self.stall_threshold:
+            return True
         return float(self.rate) == 0.0
 
     @property
@@ -72,7 +236,31 @@ class ETA(object):
     @property
     def eta_seconds(self):
         """Returns the ETA in seconds or None if there is no data yet."""
-        return None if self.eta_epoch is None else max([self.eta_epoch - _NOW(), 0])
+        return None if self.eta_epoch is None else max([self.eta_epoch - self._now(), 0])
+
+    @property
+    def eta_wall_epoch(self):
+        """Returns the ETA in seconds since Unix epoch (like time.time()) or None if there is no data yet."""
+        return None if self.eta_epoch is None else self.eta_epoch - self._now() + _WALL()
+
+    @property
+    def eta_low(self):
+        """Returns the optimistic end of the ETA's 95% confidence interval in seconds. See eta_interval()."""
+        return self.eta_interval()[0]
+
+    @property
+    def eta_high(self):
+        """Returns the pessimistic end of the ETA's 95% confidence interval in seconds. See eta_interval()."""
+        return self.eta_interval()[1]
+
+    @property
+    def rate_error(self):
+        """Returns the standard error of the rate or None if unknown (not enough data or unsupported by estimator)."""
+        if not self.started:
+            return None
+        if self._stale:
+            self._refresh()
+        return self._estimator.rate_error()
 
     @property
     def percent(self):
@@ -82,13 +270,17 @@ class ETA(object):
     @property
     def elapsed(self):
         """Returns the number of seconds it has been since the start until the latest entry."""
-        if not self.started or self._start_time is None:
+        if self._pending is not None:
+            self._settle()
+        if not self.started:
             return 0.0
-        return self._timing_data[-1][0] - self._start_time
+        return self._timing_data.x_at(-1)
 
     @property
     def rate_unstable(self):
         """Returns an unstable rate based on the last two entries in the timing data. Less intensive to compute."""
+        if self._pending is not None:
+            self._settle()
         if not self.started or self.stalled:
             return 0.0
         x1, y1 = self._timing_data[-2]
@@ -101,6 +293,28 @@ class ETA(object):
         elapsed = self.elapsed
         return self.rate if not elapsed else self.numerator / self.elapsed
 
+    def eta_interval(self, z=1.96):
+        """Returns the confidence interval of the ETA in seconds, based on the rate's standard error.
+
+        eta_seconds is scaled by rate / (rate + z * rate_error) and rate / (rate - z * rate_error). Nothing is
+        calculated until this is called, so it doesn't add to the cost of updates.
+
+        Keyword arguments:
+        z -- number of standard errors on each side. 1.96 (default) for a 95% interval, 1.0 for about 68%.
+
+        Returns:
+        2-item tuple, the low and high number of seconds. Both None if unknown, high is None if unbounded (the rate
+            may be 0).
+        """
+        eta_seconds = self.eta_seconds
+        error = self.rate_error
+        rate = self.rate
+        if eta_seconds is None or error is None or rate <= 0:
+            return None, None
+        low = eta_seconds * rate / (rate + z * error)
+        high = eta_seconds * rate / (rate - z * error) if rate > z * error else None
+        return low, high
+
     def set_numerator(self, numerator, calculate=True):
         """Sets the new numerator (number of items done).
 
@@ -111,59 +325,472 @@ class ETA(object):
         calculate -- calculate the ETA and rate by default.
         """
         # Validate
-        if self._timing_data and numerator < self._timing_data[-1][1]:
+        if self._pending is not None:
+            previous = self._pending[1]
+        elif self._timing_data:
+            previous = self._timing_data.y_at(-1)
+        else:
+            previous = None
+        if previous is not None and numerator < previous:
             raise ValueError('numerator cannot decrement.')
+        now = self._now() - self._start_time
+        if previous is None or numerator > previous:
+            self._progress_time = now
 
-        # Update data.
-        now = _NOW()
-        if self._timing_data and now == self._timing_data[-1][0]:
-            self._timing_data[-1] = (now, numerator)  # Overwrite.
+        # Hold back updates arriving too soon after the latest entry (min_interval only). O(1), nothing is calculated.
+        if self.min_interval and self._timing_data and now - self._timing_data.x_at(-1) < self.min_interval:
+            if self.undefined or numerator < self.denominator:
+                self._pending = (now, numerator)
+                return
+
+        self._pending = None
+        self._commit(now, numerator, calculate)
+
+    def flush(self, calculate=True):
+        """Adds the numerator held back by min_interval (if any) with the time it was set.
+
+        Keyword arguments:
+        calculate -- calculate the ETA and rate by default.
+        """
+        if self._pending is None:
+            return
+        now, numerator = self._pending
+        self._pending = None
+        self._commit(now, numerator, calculate)
+
+    def add(self, delta):
+        """Adds units done to the counter. Safe to call from many threads at once, the timing data isn't touched.
+
+        The numerator isn't updated until sample() is called. Don't mix with setting the numerator directly.
+
+        Positional arguments:
+        delta -- number of units done since the previous call (by this thread).
+        """
+        self.counter.add(delta)
+
+    def sample(self, calculate=True):
+        """Sets the numerator to the counter's value (the sum of all add() calls). Call from one thread only.
+
+        Keyword arguments:
+        calculate -- calculate the ETA and rate by default.
+
+        Returns:
+        The new numerator.
+        """
+        numerator = self.counter.value
+        self.set_numerator(numerator, calculate=calculate)
+        return numerator
+
+    def extend(self, pairs, calculate=True):
+        """Adds many entries at once, such as samples collected elsewhere and forwarded in a batch.
+
+        All entries are validated before any are added, and the ETA and rate are calculated only once at the end.
+        NumPy arrays with a shape of (n, 2) are validated with vectorized operations. A numerator held back by
+        min_interval is added first.
+
+        Positional arguments:
+        pairs -- iterable of 2-item sequences (timestamp, numerator), oldest first. Timestamps must be in the same time
+            base as the ETA's clock (time.monotonic() by default). Neither may decrement.
+
+        Keyword arguments:
+        calculate -- calculate the ETA and rate by default.
+        """
+        if hasattr(pairs, 'shape') and hasattr(pairs, 'tolist'):
+            if len(pairs) > 1 and ((pairs[1:, 0] < pairs[:-1, 0]).any() or (pairs[1:, 1] < pairs[:-1, 1]).any()):
+                raise ValueError('timestamps and numerators cannot decrement.')
+            pairs = pairs.tolist()
         else:
-            self._timing_data.append((now, numerator))
+            pairs = list(pairs)
+            for i in range(1, len(pairs)):
+                if pairs[i][0] < pairs[i - 1][0] or pairs[i][1] < pairs[i - 1][1]:
+                    raise ValueError('timestamps and numerators cannot decrement.')
+        if not pairs:
+            return
+
+        # Validate against existing data.
+        self.flush(calculate=False)
+        start_time = self._start_time
+        if self._timing_data:
+            if pairs[0][1] < self._timing_data.y_at(-1):
+                raise ValueError('numerator cannot decrement.')
+            if pairs[0][0] - start_time < self._timing_data.x_at(-1):
+                raise ValueError('timestamps cannot decrement.')
+
+        # Update data.
+        add_entry = self._add_entry
+        previous = self._timing_data.y_at(-1) if self._timing_data else None
+        for timestamp, numerator in pairs:
+            add_entry(timestamp - start_time, numerator)
+            if previous is None or numerator > previous:
+                self._progress_time = timestamp - start_time
+            previous = numerator
+        if self._group is not None:
+            self._group._update(self)
 
         # Calculate ETA and rate.
-        if not self.done and calculate and self.started:
+        if calculate and self.lazy:
+            self._stale = True
+        elif calculate and not self.done and self.started:
             self._calculate()
 
+    def to_bytes(self):
+        """Returns the state (denominator and timing data) as a compact binary string. Restore with from_bytes().
+
+        The layout is fixed: a 33-byte header followed by 16 bytes per entry, all little-endian. A numerator held back
+        by min_interval is included as the latest entry (replacing one with the same timestamp).
+        """
+        pairs = list(self._timing_data)
+        if self._pending is not None and pairs and pairs[-1][0] == self._pending[0]:
+            pairs[-1] = self._pending
+        elif self._pending is not None:
+            pairs.append(self._pending)
+        values = [value for pair in pairs for value in pair]
+        header = _STATE_HEADER.pack(
+            _STATE_MAGIC, _STATE_VERSION, len(pairs), self.denominator or 0, self._now() - self._start_time,
+            self._progress_time
+        )
+        return header + struct.pack('<{0}d'.format(len(values)), *values)
+
+    @classmethod
+    def from_bytes(cls, data, **kwargs):
+        """Returns a new instance with the state returned by to_bytes(). See restore().
+
+        Positional arguments:
+        data -- binary string returned by to_bytes().
+
+        Keyword arguments:
+        kwargs -- passed to the new instance (e.g. scope, clock). denominator is taken from data.
+        """
+        eta = cls(**kwargs)
+        eta.restore(data)
+        return eta
+
+    def restore(self, data):
+        """Replaces the state of this instance with the state returned by to_bytes(), such as from a checkpoint.
+
+        Timestamps are rebased as if no time passed between to_bytes() and restore(), so the rate and ETA are available
+        right away based on the restored timing data. Entries are added like set_numerator() would (only the latest
+        `scope` entries are kept, window_seconds applies) but aren't recorded in the histogram. Numerators are restored
+        as floats. If this instance is in a group, the group picks up the restored numerator and denominator without
+        counting the difference as progress.
+
+        Positional arguments:
+        data -- binary string returned by to_bytes().
+        """
+        count, denominator, elapsed, progress_time = _unpack_state(data)
+        values = struct.unpack_from('<{0}d'.format(count * 2), data, _STATE_HEADER.size)
+
+        # Rebase and replace.
+        self.denominator = denominator
+        self._start_time = self._now() - elapsed
+        self._progress_time = progress_time
+        self._pending = None
+        self._eta_epoch, self._rate = None, 0.0
+        self._timing_data = type(self._timing_data)((), self._timing_data.maxlen)
+        histogram, self.histogram = self.histogram, None
+        for x, y in zip(values[::2], values[1::2]):
+            self._add_entry(x, y)
+        self.histogram = histogram
+        if self._group is not None:
+            self._group._rebase(self)
+
+        # Calculate ETA and rate.
+        if self.lazy:
+            self._stale = True
+        elif not self.done and self.started:
+            self._calculate()
+
+    def _commit(self, now, numerator, calculate):
+        """Adds an entry, notifies the group (if any), and calculates the ETA and rate. No validation is done.
+
+        Positional arguments:
+        now -- timestamp of the entry (relative to _start_time).
+        numerator -- numerator of the entry.
+        calculate -- calculate the ETA and rate.
+        """
+        # Update data.
+        self._add_entry(now, numerator)
+        if self._group is not None:
+            self._group._update(self)
+
+        # Calculate ETA and rate.
+        if calculate and self.lazy:
+            self._stale = True
+        elif calculate and not self.done and self.started:
+            self._calculate()
+
+    def _add_entry(self, now, numerator):
+        """Adds an entry to the timing data and estimator. No validation is done.
+
+        Positional arguments:
+        now -- timestamp of the entry (relative to _start_time).
+        numerator -- numerator of the entry.
+        """
+        timing_data = self._timing_data
+        estimator = self._estimator
+        if self.histogram is not None and timing_data and now > timing_data.x_at(-1):
+            elapsed = now - timing_data.x_at(-1)
+            self.histogram.record((numerator - timing_data.y_at(-1)) / elapsed, elapsed)
+        if timing_data and (now == timing_data.x_at(-1) or self._coalesce(now)):
+            estimator.replace_last(timing_data.x_at(-1), timing_data.y_at(-1), now, numerator)
+            timing_data.replace_last(now, numerator)  # Overwrite.
+        elif len(timing_data) == timing_data.maxlen:
+            estimator.remove(timing_data.x_at(0), timing_data.y_at(0))  # Oldest entry is about to be pushed off.
+            estimator.add(now, numerator)
+            timing_data.push(now, numerator)
+            self._removals += 1
+        else:
+            estimator.add(now, numerator)
+            timing_data.push(now, numerator)
+
+        # Drop entries that have aged out of the time window. Each entry is dropped once so this is amortized O(1).
+        if self.window_seconds:
+            oldest = now - self.window_seconds
+            while len(timing_data) > 2 and timing_data.x_at(0) < oldest:
+                estimator.remove(*timing_data.popleft())
+                self._removals += 1
+
+        # Running sums accumulate floating point error as entries come and go. Rebuild them once per full window.
+        if self._removals and self._removals >= (timing_data.maxlen or len(timing_data)):  # maxlen None if unlimited.
+            estimator.resync(timing_data)
+            self._removals = 0
+
+    def _now(self):
+        """Returns the current time from the clock."""
+        return (self._clock or _NOW)()
+
+    def _settle(self):
+        """Adds the numerator held back by min_interval (with the time it was set) once min_interval has passed since
+        the latest entry, so reading the rate or ETA after the final update doesn't show outdated data forever.
+
+        Returns:
+        True if it was added.
+        """
+        if self._pending is None or self._now() - self._start_time - self._timing_data.x_at(-1) < self.min_interval:
+            return False
+        self.flush()
+        return True
+
+    def _decay(self):
+        """Returns the factor (0 to 1) the rate is multiplied by when stall_threshold is exceeded. 1.0 if not."""
+        seconds = self.seconds_since_progress
+        return 1.0 if seconds <= self.stall_threshold else self.stall_threshold / seconds
+
+    def _coalesce(self, now):
+        """Returns True if a new entry should overwrite the latest one instead of being appended (window_seconds only).
+
+        Entries are kept at least _window_spacing apart from the one two positions back, which bounds the number of
+        entries within window_seconds to about `scope`.
+
+        Positional arguments:
+        now -- timestamp (relative to _start_time) of the new entry.
+        """
+        if not self._window_spacing or len(self._timing_data) < 2:
+            return False
+        return now - self._timing_data.x_at(-2) < self._window_spacing
+
     def _calculate(self):
-        """Perform the ETA and rate calculation.
-
-        Two linear lines are used to calculate the ETA: the linear regression (line through a scatter-plot), and the
-        fitted line (a line that runs through the latest data point in _timing_data but parallel to the linear
-        regression line).
-
-        As the percentage moves closer to 100%, _calculate() gradually uses the ETA based on the fitted line more and
-        more. This is done to prevent an ETA that's in the past.
-
-        http://code.activestate.com/recipes/578914-simple-linear-regression-with-pure-python/
-        http://en.wikipedia.org/wiki/Pearson_product-moment_correlation_coefficient
-        """
-        # Calculate means and standard deviations.
-        mean_x = sum(i[0] for i in self._timing_data) / len(self._timing_data)
-        mean_y = sum(i[1] for i in self._timing_data) / len(self._timing_data)
-        std_x = sqrt(sum(pow(i[0] - mean_x, 2) for i in self._timing_data) / (len(self._timing_data) - 1))
-        std_y = sqrt(sum(pow(i[1] - mean_y, 2) for i in self._timing_data) / (len(self._timing_data) - 1))
-
-        # Calculate coefficient.
-        sum_xy, sum_sq_v_x, sum_sq_v_y = 0, 0, 0
-        for x, y in self._timing_data:
-            x -= mean_x
-            y -= mean_y
-            sum_xy += x * y
-            sum_sq_v_x += pow(x, 2)
-            sum_sq_v_y += pow(y, 2)
-        pearson_r = sum_xy / sqrt(sum_sq_v_x * sum_sq_v_y)
-
-        # Calculate regression line. y = mx + b where m is the slope and b is the y-intercept.
-        m = self.rate = pearson_r * (std_y / std_x)
+        """Perform the ETA and rate calculation using the estimator.
+
+        The estimator is kept up to date by set_numerator(), so with the built-in estimators this runs in constant time
+        no matter how large `scope` is.
+        """
+        rate, eta_x = self._estimator.calculate(
+            self._timing_data.x_at(-1), self._timing_data.y_at(-1), None if self.undefined else self.denominator
+        )
+        self._rate = rate
         if self.undefined:
             return
-        y = self.denominator
-        b = mean_y - m * mean_x
-        x = (y - b) / m
-
-        # Calculate fitted line (transformed/shifted regression line horizontally).
-        fitted_b = self._timing_data[-1][1] - (m * self._timing_data[-1][0])
-        fitted_x = (y - fitted_b) / m
-        adjusted_x = ((fitted_x - x) * (self.numerator / self.denominator)) + x
-        self.eta_epoch = adjusted_x
+        self._eta_epoch = None if eta_x is None else self._start_time + eta_x
+
+    def _refresh(self):
+        """Calculates the outdated rate and ETA (lazy only)."""
+        self._stale = False
+        if not self.done and self.started:
+            self._calculate()
+
+
+class ETAGroup(object):
+    """Calculates the overall rate and ETA of many child ETA instances (or progress bars), like concurrent downloads.
+
+    Children notify the group whenever their numerator is set, and the group applies the difference to its running
+    totals. The cost of an update doesn't depend on the number of children. The overall rate is fitted on the group's
+    cumulative progress (the sum of all children's progress since they joined) by an internal ETA instance.
+
+    Children may join or leave at any time. Work done by a child before it joined isn't counted as progress. Work done
+    by a child that left is still counted, but its remaining work isn't. A child's denominator change is picked up the
+    next time its numerator is set. The group is undefined while any child is undefined.
+
+    Positional arguments:
+    children -- iterable of ETA instances or progress bars to add with a weight of 1.
+
+    Keyword arguments:
+    eta_kwargs -- passed to the internal ETA instance (e.g. scope, window_seconds, clock). lazy is True by default since
+        children usually update much more often than the group is read. window_seconds is 60 by default: every child
+        update adds an entry, so a window of `scope` entries alone would only cover the last fraction of a second with
+        many children updating often.
+
+    Instance variables:
+    _children -- dictionary of child ETA instances and lists of their [weight, numerator, denominator] as last seen.
+        denominator is None if the child is undefined.
+    _eta -- internal ETA instance. Its numerator is the cumulative progress and its denominator the cumulative progress
+        plus remaining work.
+    _progress -- weighted sum of all progress made by children since they joined.
+    _remaining -- weighted sum of remaining work (denominator - numerator) of defined children.
+    _undefined -- number of undefined children.
+    """
+
+    def __init__(self, children=(), **eta_kwargs):
+        eta_kwargs.setdefault('lazy', True)
+        eta_kwargs.setdefault('window_seconds', 60)
+        self._children = dict()
+        self._eta = ETA(**eta_kwargs)
+        self._progress = 0
+        self._remaining = 0
+        self._undefined = 0
+        for child in children:
+            self.add(child)
+
+    def __len__(self):
+        """Returns the number of children."""
+        return len(self._children)
+
+    @property
+    def denominator(self):
+        """Returns the total amount of work, the progress made so far plus remaining work. 0 if undefined."""
+        return self._eta.denominator
+
+    @property
+    def numerator(self):
+        """Returns the progress made so far."""
+        return self._progress
+
+    @property
+    def undefined(self):
+        """Returns True if there are no children or if any child is undefined."""
+        return self._eta.undefined
+
+    @property
+    def done(self):
+        """Returns True if all children are done."""
+        return not self.undefined and self._remaining <= 0
+
+    @property
+    def rate(self):
+        """Returns the overall rate of progress (float)."""
+        return self._eta.rate
+
+    @property
+    def stalled(self):
+        """Returns True if the overall rate is 0."""
+        return self._eta.stalled
+
+    @property
+    def eta_epoch(self):
+        """Returns the expected time of completion of all children or None if unknown."""
+        return None if self.done else self._eta.eta_epoch
+
+    @property
+    def eta_seconds(self):
+        """Returns the ETA of all children in seconds or None if unknown."""
+        return None if self.done else self._eta.eta_seconds
+
+    @property
+    def percent(self):
+        """Returns the percent as a float."""
+        return self._eta.percent
+
+    def add(self, child, weight=1):
+        """Adds a child. Its remaining work counts towards the group from now on.
+
+        Positional arguments:
+        child -- ETA instance or progress bar. May only be in one group at a time.
+
+        Keyword arguments:
+        weight -- multiplies the child's units (e.g. to mix children counting different units).
+        """
+        child = getattr(child, '_eta', child)  # Progress bars hold their ETA instance here.
+        if child._group is not None:
+            raise ValueError('child is already in a group.')
+        child._group = self
+        numerator, denominator = child.numerator, None if child.undefined else child.denominator
+        self._children[child] = [weight, numerator, denominator]
+        if denominator is None:
+            self._undefined += 1
+        else:
+            self._remaining += (denominator - numerator) * weight
+        self._recalculate()
+
+    def remove(self, child):
+        """Removes a child. Its progress is still counted but its remaining work no longer is.
+
+        Positional arguments:
+        child -- ETA instance or progress bar previously added.
+        """
+        child = getattr(child, '_eta', child)
+        weight, numerator, denominator = self._children.pop(child)
+        child._group = None
+        if denominator is None:
+            self._undefined -= 1
+        else:
+            self._remaining -= (denominator - numerator) * weight
+        self._recalculate()
+
+    def _totals(self):
+        """Updates the internal ETA's denominator from the running totals."""
+        self._eta.denominator = 0 if self._undefined or not self._children else self._progress + self._remaining
+
+    def _recalculate(self):
+        """Recalculates the rate and ETA after the totals changed without progress (children joining or leaving)."""
+        self._totals()
+        eta = self._eta
+        if eta.lazy:
+            eta._stale = True
+        elif not eta.done and eta.started:
+            eta._calculate()
+
+    def _rebase(self, child):
+        """Called by a child after its state was restored. Applies the new remaining work without counting progress.
+
+        Positional arguments:
+        child -- the child ETA instance.
+        """
+        self._apply(child)
+        self._recalculate()
+
+    def _update(self, child):
+        """Called by a child after its numerator is set. Applies the differences to the running totals.
+
+        Positional arguments:
+        child -- the child ETA instance.
+        """
+        self._progress += self._apply(child)
+
+        # Record the cumulative progress.
+        self._totals()
+        self._eta.set_numerator(self._progress)
+
+    def _apply(self, child):
+        """Applies the differences of a child's remaining work to the running totals and remembers its new state.
+
+        Positional arguments:
+        child -- the child ETA instance.
+
+        Returns:
+        The weighted difference of the child's numerator since it was last seen.
+        """
+        state = self._children[child]
+        weight, old_numerator, old_denominator = state
+        numerator, denominator = child.numerator, None if child.undefined else child.denominator
+
+        # Update totals.
+        if old_denominator is None:
+            self._undefined -= 1
+        else:
+            self._remaining -= (old_denominator - old_numerator) * weight
+        if denominator is None:
+            self._undefined += 1
+        else:
+            self._remaining += (denominator - numerator) * weight
+        state[1], state[2] = numerator, denominator
+        return (numerator - old_numerator) * weight
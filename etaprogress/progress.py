@@ -5,14 +5,14 @@ https://pypi.python.org/pypi/etaprogress
 """
 
 from __future__ import division
-from decimal import Decimal, ROUND_DOWN
-import locale
 
 from etaprogress.components.bars import Bar, BarDoubled, BarUndefinedAnimated, BarUndefinedEmpty
 from etaprogress.components.base_progress_bar import BaseProgressBar
 from etaprogress.components.eta_conversions import eta_hms, eta_letters
-from etaprogress.components.misc import get_remaining_width, SPINNER
-from etaprogress.components.units import UnitBit, UnitByte
+from etaprogress.components.layout import Layout
+from etaprogress.components.locale_format import LOCALE, truncate
+from etaprogress.components.misc import get_available_width, SPINNER
+from etaprogress.components.units import BITS, BYTES, BYTES_NO_THOUSANDS, scale
 
 __all__ = ('ProgressBar', 'ProgressBarBits', 'ProgressBarBytes', 'ProgressBarWget', 'ProgressBarYum')
 
@@ -30,6 +30,7 @@ class ProgressBar(BaseProgressBar):
 
     Keyword arguments:
     max_with -- limit number of characters shown (by default the full progress bar takes up the entire terminal width).
+    kwargs -- passed to BaseProgressBar (e.g. eta_every) and then to etaprogress.eta.ETA (e.g. scope, clock).
 
     Instance variables:
     template -- string template of the full progress bar.
@@ -38,8 +39,8 @@ class ProgressBar(BaseProgressBar):
     More instance variables in etaprogress.components.base_progress_bar.BaseProgressBar.
     """
 
-    def __init__(self, denominator, max_width=None):
-        super(ProgressBar, self).__init__(denominator, max_width=max_width)
+    def __init__(self, denominator, max_width=None, **kwargs):
+        super(ProgressBar, self).__init__(denominator, max_width=max_width, **kwargs)
         if self.undefined:
             self.template = '{numerator} {bar} eta --:-- {spinner}'
             self.bar = BarUndefinedAnimated()
@@ -48,23 +49,34 @@ class ProgressBar(BaseProgressBar):
             self.bar = Bar()
 
     def __str__(self):
-        """Returns the fully-built progress bar and other data."""
-        # Partially build out template.
-        bar = '{bar}'
+        """Returns the fully-built progress bar and other data. Only the spinner is redrawn if nothing else changed."""
         spinner = next(SPINNER)
+        available = get_available_width(self.max_width or None)
+        key = (self.numerator, self._eta.denominator, self.force_done, self._eta_string, available, self.layout)
+        if key != self._render_key:
+            self._render_key = key
+            self._render_cache = self._build_segments(available)
+        segments, widths = self._render_cache
+        self.layout.put(segments, 'spinner', spinner)
+        if self.bar.ANIMATED and 'bar' in widths:
+            self.layout.put(segments, 'bar', self.bar.bar(widths['bar'], percent=self.percent))
+        return ''.join(segments)
+
+    def _build_segments(self, available):
+        """Returns layout.fill() results with everything but the spinner (and an animated bar) filled in.
+
+        Positional arguments:
+        available -- number of characters available for the whole progress bar.
+        """
         if self.undefined:
-            numerator = self.str_numerator
-            template = self.template.format(numerator=numerator, bar=bar, spinner=spinner)
+            values = dict(numerator=self.str_numerator, spinner='-')
         else:
-            percent = int(self.percent)
-            fraction = self.str_fraction
-            eta = self._eta_string or '--:--'
-            template = self.template.format(percent=percent, fraction=fraction, bar=bar, eta=eta, spinner=spinner)
-
-        # Determine bar width and finish.
-        width = get_remaining_width(template.format(bar=''), self.max_width or None)
-        bar = self.bar.bar(width, percent=self.percent)
-        return template.format(bar=bar)
+            values = dict(percent=int(self.percent), fraction=self.str_fraction, eta=self._eta_string or '--:--',
+                          spinner='-')  # Spinner characters are all the same width.
+        segments, widths = self.layout.fill(values, available)
+        if not self.bar.ANIMATED and 'bar' in widths:
+            self.layout.put(segments, 'bar', self.bar.bar(widths['bar'], percent=self.percent))
+        return segments, widths
 
     @staticmethod
     def _generate_eta(seconds):
@@ -76,14 +88,14 @@ class ProgressBar(BaseProgressBar):
         """Returns the fraction with additional whitespace."""
         if self.undefined:
             return None
-        denominator = locale.format('%d', self.denominator, grouping=True)
+        denominator = LOCALE.integer(self.denominator)
         numerator = self.str_numerator.rjust(len(denominator))
         return '{0}/{1}'.format(numerator, denominator)
 
     @property
     def str_numerator(self):
         """Returns the numerator as a formatted string."""
-        return locale.format('%d', self.numerator, grouping=True)
+        return LOCALE.integer(self.numerator)
 
 
 class ProgressBarBits(ProgressBar):
@@ -99,16 +111,17 @@ class ProgressBarBits(ProgressBar):
 
     Keyword arguments:
     max_with -- limit number of characters shown (by default the full progress bar takes up the entire terminal width).
+    kwargs -- passed to BaseProgressBar (e.g. eta_every) and then to etaprogress.eta.ETA (e.g. scope, clock).
 
     Instance variables:
-    _unit_class -- class object responsible for converting bits into megabits/etc.
+    _unit_table -- etaprogress.components.units table used to convert bits into megabits/etc.
 
     More instance variables in etaprogress.progress.ProgressBar.
     """
 
-    def __init__(self, denominator, max_width=None):
-        super(ProgressBarBits, self).__init__(denominator, max_width)
-        self._unit_class = UnitBit
+    def __init__(self, denominator, max_width=None, **kwargs):
+        super(ProgressBarBits, self).__init__(denominator, max_width, **kwargs)
+        self._unit_table = BITS
 
     @property
     def str_fraction(self):
@@ -117,17 +130,21 @@ class ProgressBarBits(ProgressBar):
             return None
 
         # Determine denominator and its unit.
-        unit_denominator, unit = self._unit_class(self.denominator).auto
-        formatter = '%d' if unit_denominator == self.denominator else '%0.2f'
-        denominator = locale.format(formatter, unit_denominator, grouping=True)
+        unit_denominator, unit = scale(self.denominator, self._unit_table)
+        whole = unit_denominator == self.denominator  # Shown without decimal places if not converted.
+        denominator = LOCALE.integer(unit_denominator) if whole else LOCALE.fixed(unit_denominator, 2, grouping=True)
 
         # Determine numerator.
-        unit_numerator = getattr(self._unit_class(self.numerator), unit)
+        unit_numerator = scale(self.numerator, self._unit_table, unit)[0]
         if self.done:
             rounded_numerator = unit_numerator
         else:
-            rounded_numerator = float(Decimal(str(unit_numerator)).quantize(Decimal('.01'), rounding=ROUND_DOWN))
-        numerator = locale.format(formatter, rounded_numerator, grouping=True).rjust(len(denominator))
+            rounded_numerator = truncate(unit_numerator, 2)
+        if whole:
+            numerator = LOCALE.integer(rounded_numerator)
+        else:
+            numerator = LOCALE.fixed(rounded_numerator, 2, grouping=True)
+        numerator = numerator.rjust(len(denominator))
 
         return '{0}/{1} {2}'.format(numerator, denominator, unit)
 
@@ -136,9 +153,11 @@ class ProgressBarBits(ProgressBar):
         """Returns the numerator with formatting."""
         if not self.undefined:
             return None
-        unit_numerator, unit = self._unit_class(self.numerator).auto
-        formatter = '%d' if unit_numerator == self.numerator else '%0.2f'
-        numerator = locale.format(formatter, unit_numerator, grouping=True)
+        unit_numerator, unit = scale(self.numerator, self._unit_table)
+        if unit_numerator == self.numerator:
+            numerator = LOCALE.integer(unit_numerator)
+        else:
+            numerator = LOCALE.fixed(unit_numerator, 2, grouping=True)
         return '{0} {1}'.format(numerator, unit)
 
 
@@ -155,16 +174,17 @@ class ProgressBarBytes(ProgressBarBits):
 
     Keyword arguments:
     max_with -- limit number of characters shown (by default the full progress bar takes up the entire terminal width).
+    kwargs -- passed to BaseProgressBar (e.g. eta_every) and then to etaprogress.eta.ETA (e.g. scope, clock).
 
     Instance variables:
-    _unit_class -- class object responsible for converting bytes into mebibytes/etc.
+    _unit_table -- etaprogress.components.units table used to convert bytes into mebibytes/etc.
 
     More instance variables in etaprogress.progress.ProgressBarBits.
     """
 
-    def __init__(self, denominator, max_width=None):
-        super(ProgressBarBytes, self).__init__(denominator, max_width)
-        self._unit_class = UnitByte
+    def __init__(self, denominator, max_width=None, **kwargs):
+        super(ProgressBarBytes, self).__init__(denominator, max_width, **kwargs)
+        self._unit_table = BYTES
 
 
 class ProgressBarWget(BaseProgressBar):
@@ -182,6 +202,7 @@ class ProgressBarWget(BaseProgressBar):
     Keyword arguments:
     max_with -- limit number of characters shown (by default the full progress bar takes up the entire terminal width).
     eta_every -- calculate and cache the ETA string after this many numerator setting iteration. Default is every iter.
+    kwargs -- passed to etaprogress.eta.ETA (e.g. scope, clock).
 
     Instance variables:
     template -- string template of the full progress bar.
@@ -190,8 +211,8 @@ class ProgressBarWget(BaseProgressBar):
     More instance variables in etaprogress.components.base_progress_bar.BaseProgressBar.
     """
 
-    def __init__(self, denominator, max_width=None, eta_every=1):
-        super(ProgressBarWget, self).__init__(denominator, max_width=max_width, eta_every=eta_every)
+    def __init__(self, denominator, max_width=None, eta_every=1, **kwargs):
+        super(ProgressBarWget, self).__init__(denominator, max_width=max_width, eta_every=eta_every, **kwargs)
         if self.undefined:
             self.template = '    {bar} {numerator:<11s} {rate:>9s}  {eta:<12s}'
             BarUndefinedAnimated.CHAR_ANIMATED = '<=>'
@@ -203,22 +224,32 @@ class ProgressBarWget(BaseProgressBar):
             self.bar = Bar()
 
     def __str__(self):
-        """Returns the fully-built progress bar and other data."""
-        # Partially build out template.
-        bar = '{bar}'
-        numerator = locale.format('%d', self.numerator, grouping=True)
-        rate = self.str_rate
-        eta = self.str_eta
-        if self.undefined:
-            template = self.template.format(bar=bar, numerator=numerator, rate=rate, eta=eta)
-        else:
-            percent = '{0}%'.format(int(self.percent))
-            template = self.template.format(percent=percent, bar=bar, numerator=numerator, rate=rate, eta=eta)
-
-        # Determine bar width and finish.
-        width = get_remaining_width(template.format(bar=''), self.max_width or None)
-        bar = self.bar.bar(width, percent=self.percent)
-        return template.format(bar=bar)
+        """Returns the fully-built progress bar and other data. Only animated bars are redrawn if nothing changed."""
+        available = get_available_width(self.max_width or None)
+        key = (self.numerator, self._eta.denominator, self.force_done, self._eta_string, self._eta.elapsed,
+               self._eta.started, self._eta.stalled, self.rate, available, self.layout)
+        if key != self._render_key:
+            self._render_key = key
+            self._render_cache = self._build_segments(available)
+        segments, widths = self._render_cache
+        if self.bar.ANIMATED and 'bar' in widths:
+            self.layout.put(segments, 'bar', self.bar.bar(widths['bar'], percent=self.percent))
+        return ''.join(segments)
+
+    def _build_segments(self, available):
+        """Returns layout.fill() results with everything but an animated bar filled in.
+
+        Positional arguments:
+        available -- number of characters available for the whole progress bar.
+        """
+        numerator = LOCALE.integer(self.numerator)
+        values = dict(numerator=numerator, rate=self.str_rate, eta=self.str_eta)
+        if not self.undefined:
+            values['percent'] = '{0}%'.format(int(self.percent))
+        segments, widths = self.layout.fill(values, available)
+        if not self.bar.ANIMATED and 'bar' in widths:
+            self.layout.put(segments, 'bar', self.bar.bar(widths['bar'], percent=self.percent))
+        return segments, widths
 
     @staticmethod
     def _generate_eta(seconds):
@@ -242,14 +273,14 @@ class ProgressBarWget(BaseProgressBar):
         if not self._eta.started or self._eta.stalled or not self.rate:
             return '--.-KiB/s'
 
-        unit_rate, unit = UnitByte(self._eta.rate_overall if self.done else self.rate).auto
+        unit_rate, unit = scale(self._eta.rate_overall if self.done else self.rate, BYTES)
         if unit_rate >= 100:
-            formatter = '%d'
+            formatted = LOCALE.integer(unit_rate, grouping=False)
         elif unit_rate >= 10:
-            formatter = '%.1f'
+            formatted = LOCALE.fixed(unit_rate, 1)
         else:
-            formatter = '%.2f'
-        return '{0}{1}/s'.format(locale.format(formatter, unit_rate, grouping=False), unit)
+            formatted = LOCALE.fixed(unit_rate, 2)
+        return '{0}{1}/s'.format(formatted, unit)
 
 
 class ProgressBarYum(BaseProgressBar):
@@ -266,17 +297,19 @@ class ProgressBarYum(BaseProgressBar):
 
     Keyword arguments:
     max_with -- limit number of characters shown (by default the full progress bar takes up the entire terminal width).
+    kwargs -- passed to BaseProgressBar (e.g. eta_every) and then to etaprogress.eta.ETA (e.g. scope, clock).
 
     Instance variables:
     template -- string template of the full progress bar.
     template_completed -- string template of the full progress bar at 100% or force_done = True.
+    layout_completed -- template_completed compiled by etaprogress.components.layout.Layout.
     bar -- class instance of the 'bar' part of the full progress bar.
 
     More instance variables in etaprogress.components.base_progress_bar.BaseProgressBar.
     """
 
-    def __init__(self, denominator, filename, max_width=None):
-        super(ProgressBarYum, self).__init__(denominator, max_width=max_width)
+    def __init__(self, denominator, filename, max_width=None, **kwargs):
+        super(ProgressBarYum, self).__init__(denominator, max_width=max_width, **kwargs)
         self.filename = filename
         self.template = '{filename} {percent:>4s} {bar} {rate:>9s} | {numerator:>7s}  {eta:<12s}'
         self.template_completed = '{filename} | {numerator:>7s}  {eta:<12s}'
@@ -286,30 +319,52 @@ class ProgressBarYum(BaseProgressBar):
             self.bar = BarDoubled()
 
     def __str__(self):
-        """Returns the fully-built progress bar and other data."""
-        # Partially build out template.
-        filename = '{filename}'
-        numerator = self.str_numerator
-        eta = self.str_eta
-        if self.done:
-            template = self.template_completed.format(filename=filename, numerator=numerator, eta=eta)
-        else:
-            bar = '{bar}'
-            percent = '' if self.undefined else '{0}%'.format(int(self.percent))
-            rate = self.str_rate
-            template = self.template.format(filename=filename, percent=percent, bar=bar, rate=rate, numerator=numerator,
-                                            eta=eta)
-        width = get_remaining_width(template.format(bar='', filename=''), self.max_width or None)
-
-        # Filename will have 40% of the available width if not done.
+        """Returns the fully-built progress bar and other data. Reuses the previous one if nothing changed."""
+        available = get_available_width(self.max_width or None)
+        key = (self.numerator, self._eta.denominator, self.force_done, self._eta_string, self._eta.elapsed,
+               self._eta.started, self._eta.stalled, self.rate, available, self.filename, self.layout,
+               self.layout_completed)
+        if key != self._render_key:
+            self._render_key = key
+            self._render_cache = self._build_segments(available)
+        layout, segments, widths = self._render_cache
+        if self.bar.ANIMATED and 'bar' in widths:
+            layout.put(segments, 'bar', self.bar.bar(widths['bar'], percent=self.percent))
+        return ''.join(segments)
+
+    def _build_segments(self, available):
+        """Returns a 3-item tuple, the layout used (completed or not) and its fill() results with everything but an
+        animated bar filled in.
+
+        Positional arguments:
+        available -- number of characters available for the whole progress bar.
+        """
         if self.done:
-            filename = self.filename[:width].ljust(width) if width > 0 else ''
-            bar = None
+            layout = self.layout_completed
+            values = dict(numerator=self.str_numerator, eta=self.str_eta)
         else:
-            width_filename = int(width * 0.4)
-            filename = self.filename[:width_filename].ljust(width_filename) if width_filename > 0 else ''
-            bar = self.bar.bar(width - width_filename, percent=self.percent)
-        return template.format(bar=bar, filename=filename)
+            layout = self.layout
+            values = dict(percent='' if self.undefined else '{0}%'.format(int(self.percent)), rate=self.str_rate,
+                          numerator=self.str_numerator, eta=self.str_eta)
+        segments, widths = layout.fill(values, available)
+
+        # Filename gets 40% of the left over width if not done (see etaprogress.components.layout.SHARES).
+        if 'filename' in widths:
+            width = widths['filename']
+            layout.put(segments, 'filename', self.filename[:width].ljust(width) if width > 0 else '')
+        if not self.bar.ANIMATED and 'bar' in widths:
+            layout.put(segments, 'bar', self.bar.bar(widths['bar'], percent=self.percent))
+        return layout, segments, widths
+
+    @property
+    def template_completed(self):
+        """Returns the template string of the full progress bar at 100% or force_done = True."""
+        return self.layout_completed.template
+
+    @template_completed.setter
+    def template_completed(self, value):
+        """Compiles and sets a new completed template. Also accepts an etaprogress.components.layout.Layout instance."""
+        self.layout_completed = value if isinstance(value, Layout) else Layout(value)
 
     @staticmethod
     def _generate_eta(seconds):
@@ -328,12 +383,12 @@ class ProgressBarYum(BaseProgressBar):
     @property
     def str_numerator(self):
         """Returns the numerator with formatting."""
-        unit_numerator, unit = UnitByte(self.numerator).auto_no_thousands
+        unit_numerator, unit = scale(self.numerator, BYTES_NO_THOUSANDS)
         if unit_numerator >= 10:
-            formatter = '%d'
+            formatted = LOCALE.integer(unit_numerator, grouping=False)
         else:
-            formatter = '%0.1f'
-        return '{0} {1}'.format(locale.format(formatter, unit_numerator, grouping=False), unit)
+            formatted = LOCALE.fixed(unit_numerator, 1)
+        return '{0} {1}'.format(formatted, unit)
 
     @property
     def str_rate(self):
@@ -342,9 +397,9 @@ class ProgressBarYum(BaseProgressBar):
         if not self._eta.started or self._eta.stalled or not self.rate:
             return '--- KiB/s'
 
-        unit_rate, unit = UnitByte(self.rate).auto_no_thousands
+        unit_rate, unit = scale(self.rate, BYTES_NO_THOUSANDS)
         if unit_rate >= 10:
-            formatter = '%d'
+            formatted = LOCALE.integer(unit_rate, grouping=False)
         else:
-            formatter = '%0.1f'
-        return '{0} {1}/s'.format(locale.format(formatter, unit_rate, grouping=False), unit)
+            formatted = LOCALE.fixed(unit_rate, 1)
+        return '{0} {1}/s'.format(formatted, unit)
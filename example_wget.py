@@ -36,23 +36,18 @@ def error(message, code=1):
 
 
 class DownloadThread(threading.Thread):
-    """Downloads the file, but doesn't save it (just the file size)."""
+    """Downloads the file, but doesn't save it (just the file size). Adds downloaded bytes to the progress bar."""
 
-    def __init__(self, response):
+    def __init__(self, response, progress_bar):
         super(DownloadThread, self).__init__()
         self.response = response
+        self.progress_bar = progress_bar
 
-        self._bytes_downloaded = 0
         self.daemon = True
 
     def run(self):
         for chunk in self.response.iter_content(1024):
-            self._bytes_downloaded += len(chunk)
-
-    @property
-    def bytes_downloaded(self):
-        """Read-only interface to _bytes_downloaded."""
-        return self._bytes_downloaded
+            self.progress_bar.add(len(chunk))
 
 
 def main():
@@ -65,13 +60,13 @@ def main():
     response = requests.get(OPTIONS['<url>'], stream=True)
     content_length = None if OPTIONS['--ignore-length'] else int(response.headers.get('Content-Length'))
     progress_bar = ProgressBarWget(content_length, eta_every=4)
-    thread = DownloadThread(response)
+    thread = DownloadThread(response, progress_bar)
     print_every_seconds = 0.25
 
     # Download.
     thread.start()
     while True:
-        progress_bar.numerator = thread.bytes_downloaded
+        progress_bar.sample()
         print(progress_bar, end='\r')
         sys.stdout.flush()
 
@@ -3,6 +3,10 @@ import os
 
 import pytest
 
+from etaprogress.components import misc
+
+TERMINAL_WIDTH = misc.terminal_width  # Captured before tests replace it.
+
 
 @pytest.fixture(autouse=True, scope='session')
 def set_locale():
@@ -18,3 +22,9 @@ def set_locale():
         return
 
     locale.resetlocale()
+
+
+@pytest.fixture
+def real_terminal_width(monkeypatch):
+    """Puts the real misc.terminal_width() back for one test. Other tests replace it without restoring it."""
+    monkeypatch.setattr(misc, 'terminal_width', TERMINAL_WIDTH)
@@ -0,0 +1,83 @@
+import multiprocessing
+import threading
+
+from etaprogress import eta
+from etaprogress.components.counters import SharedCounter, ShardedCounter
+from etaprogress.progress import ProgressBarYum
+
+
+def test_sharded_counter():
+    counter = ShardedCounter(initial=5)
+    assert 5 == counter.value
+
+    def worker():
+        for _ in range(1000):
+            counter.add(2)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counter.add(1)
+
+    assert 1 == len(counter._shards)  # Shards of exited threads are folded into the initial value.
+    assert 16006 == counter.value  # Exited threads still count.
+    assert 16005 == counter._initial
+
+
+def test_eta_add_sample():
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(100)
+    assert eta_instance._counter is None  # Created on first use.
+    eta_instance.add(10)
+    assert 0 == eta_instance.numerator  # Not sampled yet.
+
+    for i in range(1, 5):
+        eta._NOW = lambda: 1411868720.0 + i
+        eta_instance.add(10)
+        assert (i + 1) * 10 == eta_instance.sample()
+
+    assert 50 == eta_instance.numerator
+    assert 10.0 == eta_instance.rate
+    assert 4 == len(eta_instance._timing_data)
+
+
+def test_progress_bar_add_sample():
+    eta._NOW = lambda: 1411868720.0
+    progress_bar = ProgressBarYum(100, 'file.iso', max_width=60)
+    progress_bar.add(30)
+    progress_bar.add(20)
+    progress_bar.sample()
+    assert 50 == progress_bar.numerator
+
+    eta._NOW = lambda: 1411868721.0
+    progress_bar.add(25)
+    progress_bar.sample()
+    assert 75 == progress_bar.numerator
+    assert 25.0 == progress_bar.rate
+    assert '00:00:01' == progress_bar._eta_string
+
+
+def _shared_worker(counter, slot):
+    counter.slot = slot
+    for _ in range(1000):
+        counter.add(3)
+
+
+def test_shared_counter():
+    counter = SharedCounter(4, initial=5)
+    processes = [multiprocessing.Process(target=_shared_worker, args=(counter, i)) for i in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert 12005 == counter.value
+
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(20000, counter=counter)
+    assert 12005 == eta_instance.sample()
+    eta._NOW = lambda: 1411868721.0
+    eta_instance.add(1000)  # Parent uses slot 0.
+    assert 13005 == eta_instance.sample()
+    assert 1000.0 == eta_instance.rate
@@ -0,0 +1,90 @@
+import pytest
+
+from etaprogress import eta
+from etaprogress.components.estimators import (BaseEstimator, EstimatorEWMA, EstimatorKalman, EstimatorRegression,
+                                               EstimatorTheilSen)
+from etaprogress.progress import ProgressBarYum
+
+
+def feed(estimator, denominator, pairs):
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(denominator, estimator=estimator)
+    for t, n in pairs:
+        eta._NOW = lambda: 1411868720.0 + t
+        eta_instance.numerator = n
+    return eta_instance
+
+
+@pytest.mark.parametrize('estimator', [EstimatorRegression(), EstimatorEWMA(), EstimatorKalman(), EstimatorTheilSen()])
+def test_constant_rate(estimator):
+    eta_instance = feed(estimator, 1000, [(i, i * 10) for i in range(1, 21)])
+    assert abs(eta_instance.rate - 10.0) < 1e-6
+    assert abs(eta_instance.eta_epoch - (1411868720.0 + 100)) < 1e-3
+
+
+@pytest.mark.parametrize('estimator', [EstimatorRegression(), EstimatorEWMA(), EstimatorKalman(), EstimatorTheilSen()])
+def test_overwrite(estimator):
+    """Same-timestamp updates replace the latest entry, estimators must end up where they would without the first."""
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(1000, estimator=estimator)
+    expected = eta.ETA(1000, estimator=estimator.__class__())
+    for i in range(1, 11):
+        eta._NOW = lambda: 1411868720.0 + i
+        eta_instance.numerator = i * 10
+        eta_instance.numerator = i * 10 + 5
+        expected.numerator = i * 10 + 5
+    assert abs(eta_instance.rate - expected.rate) < 1e-9
+
+
+def test_undefined():
+    eta_instance = feed(EstimatorEWMA(), None, [(1, 10), (2, 30)])
+    assert 20.0 == eta_instance.rate
+    assert eta_instance.eta_epoch is None
+
+
+def test_ewma_half_life():
+    estimator = EstimatorEWMA(half_life=1.0)
+    estimator.reset([(0, 0), (1, 10), (2, 30)])
+    assert 15.0 == estimator.rate
+    assert (15.0, 6.0) == estimator.calculate(2, 30, 90)
+
+
+def test_kalman_tracks_rate_change():
+    pairs = [(i, i * 10) for i in range(1, 31)] + [(i, 300 + (i - 30) * 20) for i in range(31, 61)]
+    eta_instance = feed(EstimatorKalman(process_noise=0.5), 10000, pairs)
+    assert 19.0 < eta_instance.rate < 21.0
+
+
+def test_theil_sen_burst():
+    pairs = [(i, i * 10 + (100 if i == 40 else 0)) for i in range(1, 41)]
+    regression = feed(EstimatorRegression(), 10000, pairs)
+    theil_sen = feed(EstimatorTheilSen(), 10000, pairs)
+    assert regression.rate > 10.3
+    assert 10.0 == theil_sen.rate
+
+
+def test_theil_sen_bounded():
+    estimator = EstimatorTheilSen(sample_size=4)
+    estimator.reset([(i, i * i) for i in range(10)])
+    assert [(6, 36), (7, 49), (8, 64), (9, 81)] == list(estimator._points)
+    assert [13.0, 14.0, 15.0, 15.0, 16.0, 17.0] == estimator._slopes
+    assert 15.0 == estimator.slope
+
+    estimator.remove(6, 36)
+    estimator.replace_last(9, 81, 10, 100)
+    assert [(7, 49), (8, 64), (10, 100)] == list(estimator._points)
+    assert [15.0, 17.0, 18.0] == estimator._slopes
+
+
+def test_interface():
+    estimator = BaseEstimator()
+    with pytest.raises(NotImplementedError):
+        estimator.reset([(1, 1)])
+    with pytest.raises(NotImplementedError):
+        estimator.calculate(1, 1, 10)
+
+
+def test_progress_bar():
+    estimator = EstimatorEWMA()
+    progress_bar = ProgressBarYum(1000, 'file.iso', estimator=estimator)
+    assert estimator is progress_bar._eta._estimator
@@ -0,0 +1,69 @@
+import pytest
+
+from etaprogress import eta
+from etaprogress.components.histogram import RateHistogram
+from etaprogress.progress import ProgressBarYum
+
+
+def test_record_and_query():
+    histogram = RateHistogram()
+    assert histogram.percentile(50) is None
+    assert histogram.mean is None
+
+    for value in range(1, 1001):
+        histogram.record(float(value))
+    histogram.record(0.0, weight=10)
+
+    assert 1010 == histogram.total
+    assert 10 == histogram.zero
+    assert (0.0, 1000.0) == (histogram.minimum, histogram.maximum)
+    assert abs(histogram.mean - 500500 / 1010.0) < 1e-9
+    assert 0.0 == histogram.percentile(0.5)
+    assert abs(histogram.percentile(50) - 495) / 495 < 1 / 16.0
+    assert abs(histogram.percentile(99) - 990) / 990 < 1 / 16.0
+    assert 1000.0 == histogram.percentile(100)
+    assert 0.0 == histogram.percentile(0)
+
+    buckets = list(histogram.buckets())
+    assert (0.0, 0.0, 10) == buckets[0]
+    assert (1.0, 1.0625, 1) == buckets[1]
+    assert 1000 == sum(weight for low, high, weight in buckets[1:])
+
+    with pytest.raises(ValueError):
+        histogram.record(-1)
+
+
+def test_range_and_merge():
+    first = RateHistogram(sub_buckets=4, min_exponent=0, max_exponent=4)
+    first.record(0.001)
+    first.record(1e9)
+    assert [(1.0, 1.25, 1), (14.0, 16.0, 1)] == list(first.buckets())
+    assert 1e9 == first.percentile(100)
+
+    second = RateHistogram(sub_buckets=4, min_exponent=0, max_exponent=4)
+    second.record(5.0, weight=2)
+    first.merge(second)
+    assert 4 == first.total
+    assert [(1.0, 1.25, 1), (5.0, 6.0, 2), (14.0, 16.0, 1)] == list(first.buckets())
+    assert 0.001 == first.minimum
+
+    with pytest.raises(ValueError):
+        first.merge(RateHistogram())
+
+    first.clear()
+    assert 0 == first.total
+    assert [] == list(first.buckets())
+
+
+def test_eta():
+    eta._NOW = lambda: 1411868720.0
+    histogram = RateHistogram()
+    progress_bar = ProgressBarYum(1000, 'file.iso', max_width=60, histogram=histogram)
+    for seconds, numerator in ((0, 0), (1, 100), (3, 300), (4, 300), (5, 310)):
+        eta._NOW = lambda: 1411868720.0 + seconds
+        progress_bar.numerator = numerator
+
+    assert 5 == histogram.total  # Seconds.
+    assert 1 == histogram.zero
+    assert [(0.0, 0.0, 1), (10.0, 10.5, 1), (100.0, 104.0, 3)] == list(histogram.buckets())
+    assert 62.0 == histogram.mean
@@ -0,0 +1,77 @@
+import threading
+
+from etaprogress import eta
+from etaprogress.components import instrumentation, misc
+from etaprogress.components.locale_format import LocaleFormat
+from etaprogress.progress import ProgressBarYum
+
+
+def test_disabled():
+    original_calculate, original_str = eta.ETA._calculate, ProgressBarYum.__dict__['__str__']
+    original_integer = LocaleFormat.__dict__['integer']
+    instrumentation.enable()
+    instrumentation.enable()  # No-op.
+    assert instrumentation.enabled() is True
+    assert eta.ETA._calculate is not original_calculate
+    instrumentation.disable()
+
+    assert instrumentation.enabled() is False
+    assert eta.ETA._calculate is original_calculate
+    assert ProgressBarYum.__dict__['__str__'] is original_str
+    assert isinstance(ProgressBarYum.__dict__['_generate_eta'], staticmethod)
+    assert LocaleFormat.__dict__['integer'] is original_integer
+    assert misc.query_terminal_width.__module__ == 'etaprogress.components.misc'
+
+
+def test_counts(real_terminal_width):
+    eta._NOW = lambda: 1411868720.0
+    instrumentation.enable()
+    try:
+        first = ProgressBarYum(100, 'file.iso', max_width=60)
+        second = ProgressBarYum(100, 'file.iso', max_width=60)
+        misc.set_terminal_fd(0)  # Clears the cached width.
+        for i in range(1, 4):
+            eta._NOW = lambda: 1411868720.0 + i
+            first.numerator = i * 10
+            str(first)
+        second.numerator = 5
+        str(second)
+        per_bar = instrumentation.snapshot(first)
+        stats = instrumentation.snapshot()
+    finally:
+        instrumentation.disable()
+
+    assert 2 == per_bar['calculate']['count']  # First numerator doesn't start the ETA.
+    assert 3 == per_bar['generate_eta']['count']
+    assert 3 == per_bar['render']['count']
+    assert 1 == per_bar['terminal_width']['count']  # Cached after the first query.
+    assert 5 == per_bar['locale_format']['count']  # Numerator, and rate once started.
+    assert 0 < per_bar['render']['seconds']
+
+    assert 2 == stats['calculate']['count']
+    assert 4 == stats['generate_eta']['count']
+    assert 4 == stats['render']['count']
+    assert 6 == stats['locale_format']['count']
+    assert stats['render']['seconds'] <= stats['wall_seconds']
+
+    instrumentation.reset()
+    assert 0 == instrumentation.snapshot()['render']['count']
+    assert 0 == instrumentation.snapshot(eta.ETA())['calculate']['count']
+
+
+def test_threads():
+    formatter = LocaleFormat()
+    instrumentation.enable()
+    try:
+        def format_many():
+            for _ in range(2000):
+                formatter.integer(1234)
+        threads = [threading.Thread(target=format_many) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = instrumentation.snapshot()
+    finally:
+        instrumentation.disable()
+    assert 16000 == stats['locale_format']['count']
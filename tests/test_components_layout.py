@@ -0,0 +1,50 @@
+import pytest
+
+from etaprogress.components.layout import Layout
+
+
+def test_fixed():
+    template = '{percent:3d}% ({fraction!r}) {{eta}} {eta:<6s}|{nested:>{width}}'
+    values = dict(percent=7, fraction='1/2', eta='00:01', nested='x', width=3)
+    layout = Layout(template)
+    segments, widths = layout.fill(values, 80)
+
+    assert template.format(**values) == ''.join(segments)
+    assert dict() == widths
+    assert set(['percent', 'fraction', 'eta', 'nested']) == layout.names
+
+
+def test_flexible():
+    layout = Layout('{filename} {percent:>4s} {bar} | {numerator:>7s}')
+    segments, widths = layout.fill(dict(percent='50%', numerator='10 B'), 50)
+    assert dict(filename=13, bar=21) == widths  # 34 left over, 40% to filename.
+    assert None in segments
+
+    layout.put(segments, 'filename', 'a.iso'.ljust(widths['filename']))
+    layout.put(segments, 'bar', '=' * widths['bar'])
+    layout.put(segments, 'spinner', '/')  # Not in the template.
+    line = ''.join(segments)
+    assert 'a.iso          50% ===================== |    10 B' == line
+    assert 50 == len(line)
+
+
+def test_flexible_last_gets_rest():
+    segments, widths = Layout('{bar}').fill(dict(), 7)
+    assert dict(bar=7) == widths
+
+    layout = Layout('{bar} {filename}', shares=dict(bar=0.5, filename=0.5))
+    assert dict(bar=5, filename=6) == layout.fill(dict(), 12)[1]
+
+    layout = Layout('{bar:>9}')
+    segments, widths = layout.fill(dict(), 3)
+    layout.put(segments, 'bar', '[#]')
+    assert '      [#]' == ''.join(segments)
+
+
+def test_positional():
+    with pytest.raises(ValueError):
+        Layout('{} {bar}')
+    with pytest.raises(ValueError):
+        Layout('{0} {bar}')
+    with pytest.raises(KeyError):
+        Layout('{missing} {bar}').fill(dict(), 80)
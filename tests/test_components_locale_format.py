@@ -0,0 +1,53 @@
+import locale
+
+import pytest
+
+from etaprogress.components import locale_format
+from etaprogress.components.locale_format import LocaleFormat, truncate
+
+VALUES = (0, 1, -1, 12, 999, 1000, -1234, 123456, 1234567, -1234567, 10 ** 20, 0.0, 0.005, 1.5, 12.345, 999.995,
+          1234.5678, -1234.5678, 98765432.1)
+
+
+@pytest.mark.parametrize('comma_spec', [True, False])
+@pytest.mark.parametrize('conventions', [
+    dict(thousands_sep=',', grouping=[3, 3, 0], decimal_point='.'),
+    dict(thousands_sep='.', grouping=[3, 3, 0], decimal_point=','),
+    dict(thousands_sep=',', grouping=[3, 2, 0], decimal_point='.'),
+    dict(thousands_sep=' ', grouping=[3, locale.CHAR_MAX], decimal_point=','),
+    dict(thousands_sep='', grouping=[], decimal_point='.'),
+])
+def test_same_as_locale(monkeypatch, conventions, comma_spec):
+    monkeypatch.setattr(locale_format, '_COMMA_SPEC', comma_spec)  # False like Python 2.6.
+    original = locale.localeconv
+    monkeypatch.setattr(locale, 'localeconv', lambda: dict(original(), **conventions))
+    formatter = LocaleFormat()
+
+    for value in VALUES:
+        for grouping in (True, False):
+            assert locale.format_string('%d', value, grouping=grouping) == formatter.integer(value, grouping=grouping)
+            for digits in (0, 1, 2):
+                expected = locale.format_string('%.{0}f'.format(digits), value, grouping=grouping)
+                assert expected == formatter.fixed(value, digits, grouping=grouping)
+
+
+def test_refresh(monkeypatch):
+    original = locale.localeconv
+    formatter = LocaleFormat()
+    assert '1,234.50' == formatter.fixed(1234.5, 2, grouping=True)  # Conventions captured on first use.
+
+    monkeypatch.setattr(locale, 'localeconv', lambda: dict(original(), thousands_sep='.', decimal_point=','))
+    assert '1,234.50' == formatter.fixed(1234.5, 2, grouping=True)
+    formatter.refresh()
+    assert '1.234,50' == formatter.fixed(1234.5, 2, grouping=True)
+    assert '1.234' == formatter.integer(1234.9)
+
+
+def test_truncate():
+    assert 0.29 == truncate(0.29, 2)  # 0.29 * 100 is 28.999999999999996.
+    assert 12.34 == truncate(12.3456, 2)
+    assert -12.34 == truncate(-12.3456, 2)
+    assert 5.0 == truncate(5, 2)
+    assert 12.3 == truncate(12.3, 2)
+    assert 0.0 == truncate(1.5e-05, 2)
+    assert 1e+16 == truncate(1e+16, 2)
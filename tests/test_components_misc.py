@@ -0,0 +1,68 @@
+import os
+import signal
+
+import pytest
+
+from etaprogress.components import misc
+
+
+@pytest.fixture
+def queries(monkeypatch, real_terminal_width):
+    """Replaces query_terminal_width() with one returning 101, 102, etc. Returns the list of file descriptors."""
+    fds = list()
+    monkeypatch.setattr(misc, 'query_terminal_width', lambda fd=0: fds.append(fd) or 100 + len(fds))
+    monkeypatch.setitem(misc._WIDTH_CACHE, 'watching', False)
+    monkeypatch.setitem(misc._WIDTH_CACHE, 'previous_handler', None)
+    yield fds
+    misc.set_terminal_fd(0)
+
+
+def test_terminal_width_cache(queries):
+    misc.set_terminal_fd(1)
+    assert 101 == misc.terminal_width()
+    assert 101 == misc.terminal_width()
+    assert [1] == queries
+
+    misc._WIDTH_CACHE['checked'] -= misc.POLL_INTERVAL
+    assert 102 == misc.terminal_width()
+    assert [1, 1] == queries
+
+
+def test_set_terminal_fd(queries):
+    misc.set_terminal_fd(2)
+    assert 101 == misc.terminal_width()
+    misc.set_terminal_fd(1)  # Clears the cached width.
+    assert 102 == misc.terminal_width()
+    assert [2, 1] == queries
+
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGWINCH'), reason='No SIGWINCH.')
+def test_watch_resize(queries):
+    original_handler = signal.getsignal(signal.SIGWINCH)
+    try:
+        assert misc.watch_resize() is True
+        assert misc.watch_resize() is True
+        assert misc._WIDTH_CACHE['previous_handler'] is original_handler  # Not chained to itself.
+        misc.set_terminal_fd(1)
+        assert 101 == misc.terminal_width()
+        misc._WIDTH_CACHE['checked'] -= misc.POLL_INTERVAL
+        assert 101 == misc.terminal_width()  # Not polled while watching.
+        os.kill(os.getpid(), signal.SIGWINCH)
+        assert 102 == misc.terminal_width()
+
+        # Another handler replaced ours, back to polling.
+        signal.signal(signal.SIGWINCH, signal.SIG_IGN)
+        misc._WIDTH_CACHE['checked'] -= misc.POLL_INTERVAL
+        assert 103 == misc.terminal_width()
+        assert misc._WIDTH_CACHE['watching'] is False
+    finally:
+        signal.signal(signal.SIGWINCH, original_handler)
+
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGWINCH'), reason='No SIGWINCH.')
+def test_sigwinch_chains(monkeypatch):
+    calls = list()
+    monkeypatch.setitem(misc._WIDTH_CACHE, 'previous_handler', lambda signum, frame: calls.append(signum))
+    misc._on_sigwinch(signal.SIGWINCH, None)
+    assert [signal.SIGWINCH] == calls
+    assert misc._WIDTH_CACHE['width'] is None
@@ -0,0 +1,68 @@
+from etaprogress import eta
+from etaprogress.components.regression import LinearRegression
+
+
+def two_pass_slope(points):
+    mean_x = sum(p[0] for p in points) / float(len(points))
+    mean_y = sum(p[1] for p in points) / float(len(points))
+    sum_xy = sum((p[0] - mean_x) * (p[1] - mean_y) for p in points)
+    sum_xx = sum(pow(p[0] - mean_x, 2) for p in points)
+    return sum_xy / sum_xx
+
+
+def test_add_remove():
+    regression = LinearRegression([(1411868721.5, 10), (1411868722.5, 30)])
+    assert (1411868721.5, 10) == regression.origin
+    assert 20.0 == regression.slope
+
+    regression.add(1411868723.5, 40)
+    regression.remove(1411868721.5, 10)
+    assert 2 == regression.n
+    assert 10.0 == regression.slope
+
+
+def test_empty_and_flat():
+    regression = LinearRegression()
+    assert 0 == regression.n
+
+    regression.reset([(1, 5), (2, 5), (3, 5)])
+    assert 0.0 == regression.slope
+    assert 0.0 == regression.intercept
+
+
+def test_sliding_window():
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(10000000, scope=10)
+    for i in range(1, 251):
+        eta._NOW = lambda: 1411868720.0 + i * 0.25 + (i % 7) * 0.01
+        eta_instance.numerator = i * i
+
+    points = list(eta_instance._timing_data)
+    assert 10 == len(points) == eta_instance._estimator.regression.n
+    assert abs(two_pass_slope(points) - eta_instance.rate) < 1e-6
+
+
+def test_stalled():
+    eta_instance = eta.ETA(10)
+    eta._NOW = lambda: 1411868721.0
+    eta_instance.numerator = 5
+    eta._NOW = lambda: 1411868722.0
+    eta_instance.numerator = 5
+
+    assert 0.0 == eta_instance.rate
+    assert eta_instance.eta_epoch is None
+    assert eta_instance.stalled is True
+
+
+def test_slope_error():
+    points = [(1.0, 2.0), (2.0, 4.5), (3.0, 5.5), (4.0, 8.5), (5.0, 9.0)]
+    regression = LinearRegression(points)
+    slope = two_pass_slope(points)
+    mean_x = sum(p[0] for p in points) / len(points)
+    mean_y = sum(p[1] for p in points) / len(points)
+    residuals = sum(pow(p[1] - (mean_y + slope * (p[0] - mean_x)), 2) for p in points)
+    expected = pow(residuals / (len(points) - 2) / sum(pow(p[0] - mean_x, 2) for p in points), 0.5)
+    assert abs(expected - regression.slope_error) < 1e-12
+
+    assert LinearRegression(points[:2]).slope_error is None
+    assert 0.0 == LinearRegression([(1, 1), (2, 2), (3, 3)]).slope_error
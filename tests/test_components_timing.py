@@ -0,0 +1,116 @@
+import pytest
+
+from etaprogress import eta
+from etaprogress.components.timing import NUMPY_THRESHOLD, TimingDeque, TimingNumpy, TimingRingBuffer
+
+
+def test_ring_buffer():
+    ring = TimingRingBuffer([(1, 10), (2, 20)], maxlen=3)
+    assert 2 == len(ring)
+    assert (2.0, 20.0) == ring[-1]
+    assert (1.0, 10.0) == ring[0]
+
+    ring.push(3, 30)
+    ring.push(4, 40)
+    assert [(2.0, 20.0), (3.0, 30.0), (4.0, 40.0)] == list(ring)
+    assert 2.0 == ring.x_at(0)
+    assert 40.0 == ring.y_at(-1)
+
+    ring.replace_last(4, 45)
+    ring[0] = (2.5, 25)
+    assert [(2.5, 25.0), (3.0, 30.0), (4.0, 45.0)] == list(ring)
+
+    assert (2.5, 25.0) == ring.popleft()
+    assert [(3.0, 30.0), (4.0, 45.0)] == list(ring)
+    assert type(ring.y_at(-1)) is int and type(ring.y_at(0)) is float  # Newest numerator kept as given.
+
+    with pytest.raises(IndexError):
+        ring.x_at(2)
+    with pytest.raises(ValueError):
+        TimingRingBuffer(maxlen=0)
+
+    ring.push(5, 2 ** 53 + 1)
+    ring[-1] = (5, 2 ** 60 + 1)
+    assert 2 ** 60 + 1 == ring.y_at(-1) == ring[-1][1] == list(ring)[-1][1]
+
+
+def test_compact_matches_deque():
+    eta._NOW = lambda: 1411868720.0
+    eta_deque = eta.ETA(5000, scope=8)
+    eta_compact = eta.ETA(5000, scope=8, compact=True)
+    assert isinstance(eta_deque._timing_data, TimingDeque)
+    assert isinstance(eta_compact._timing_data, TimingRingBuffer)
+
+    for i in range(1, 40):
+        eta._NOW = lambda: 1411868720.0 + i * 0.5
+        eta_deque.numerator = i * 3
+        eta_compact.numerator = i * 3
+        if i % 5 == 0:
+            eta_deque.numerator = i * 3 + 1  # Same timestamp, overwrites.
+            eta_compact.numerator = i * 3 + 1
+
+        assert eta_deque.numerator == eta_compact.numerator
+        assert type(eta_compact.numerator) is int
+        assert eta_deque.elapsed == eta_compact.elapsed
+        assert eta_deque.rate_unstable == eta_compact.rate_unstable
+        assert eta_deque.rate == eta_compact.rate
+        assert eta_deque.eta_epoch == eta_compact.eta_epoch
+
+
+def test_numpy_columns():
+    pytest.importorskip('numpy')
+    ring = TimingNumpy([(i, i * 10) for i in range(5)], maxlen=4)
+    assert [(1.0, 10.0), (2.0, 20.0), (3.0, 30.0), (4.0, 40.0)] == list(ring)
+    assert isinstance(ring.x_at(-1), float) and not hasattr(ring.x_at(-1), 'dtype')
+    x, y = ring.columns()
+    assert [1.0, 2.0, 3.0, 4.0] == x.tolist()
+    assert [10.0, 20.0, 30.0, 40.0] == y.tolist()
+
+    assert (1.0, 10.0) == ring.popleft()
+    assert [2.0, 3.0, 4.0] == ring.columns()[0].tolist()
+
+
+def test_numpy_matches_compact():
+    pytest.importorskip('numpy')
+    eta._NOW = lambda: 1411868720.0
+    eta_compact = eta.ETA(50000, scope=NUMPY_THRESHOLD, compact=True, use_numpy=False)
+    eta_numpy = eta.ETA(50000, scope=NUMPY_THRESHOLD)
+    assert isinstance(eta_compact._timing_data, TimingRingBuffer)
+    assert isinstance(eta_numpy._timing_data, TimingNumpy)
+    assert isinstance(eta.ETA(scope=100)._timing_data, TimingDeque)
+
+    for i in range(1, NUMPY_THRESHOLD * 2 + 500):
+        eta._NOW = lambda: 1411868720.0 + i * 0.01
+        eta_compact.set_numerator(i, calculate=False)
+        eta_numpy.set_numerator(i, calculate=False)
+    eta_compact.numerator = eta_numpy.numerator = NUMPY_THRESHOLD * 2 + 500
+
+    assert abs(eta_compact.rate - eta_numpy.rate) < 1e-6
+    assert abs(eta_compact.eta_epoch - eta_numpy.eta_epoch) < 1e-6
+    assert eta_compact.rate_unstable == eta_numpy.rate_unstable
+
+
+def test_numpy_numerator_type():
+    pytest.importorskip('numpy')
+    eta._NOW = lambda: 1411868720.0
+    instance = eta.ETA(2 ** 60, scope=NUMPY_THRESHOLD)
+    assert isinstance(instance._timing_data, TimingNumpy)
+    for i in range(1, 4):
+        eta._NOW = lambda: 1411868720.0 + i
+        instance.numerator = 2 ** 53 + i
+    assert 2 ** 53 + 3 == instance.numerator
+    assert isinstance(instance.numerator, int)
+
+    ring = TimingNumpy([(0, 7)], maxlen=2)
+    assert (0.0, 7) == ring.popleft()
+
+
+def test_unlimited_scope():
+    eta._NOW = lambda: 1411868720.0
+    instance = eta.ETA(100, scope=None, window_seconds=10)
+    assert isinstance(instance._timing_data, TimingDeque)
+    for i in range(1, 200):
+        eta._NOW = lambda: 1411868720.0 + i * 0.25
+        instance.numerator = i // 2
+    assert 41 == len(instance._timing_data)  # Only limited by window_seconds.
+    assert 99 == instance.numerator
@@ -0,0 +1,47 @@
+import pytest
+
+from etaprogress.components.units import BITS, BYTES, BYTES_NO_THOUSANDS, BYTES_SI, scale, scale_many, UnitBit, UnitByte
+
+
+@pytest.mark.parametrize('value,table,expected', [
+    (0, BITS, (0, 'b')),
+    (999, BITS, (999, 'b')),
+    (1000, BITS, (1.0, 'kb')),
+    (2500000, BITS, (2.5, 'mb')),
+    (10 ** 15, BITS, (1000.0, 'tb')),
+    (1023, BYTES, (1023, 'B')),
+    (1024, BYTES, (1.0, 'KiB')),
+    (1048575, BYTES, (1048575 / 1024.0, 'KiB')),
+    (1048576, BYTES, (1.0, 'MiB')),
+    (999, BYTES_NO_THOUSANDS, (999, 'B')),
+    (1000, BYTES_NO_THOUSANDS, (1000 / 1024.0, 'KiB')),
+    (1000000000, BYTES_NO_THOUSANDS, (1000000000 / 1073741824.0, 'GiB')),
+    (1000, BYTES_SI, (1.0, 'kB')),
+    (1500000000, BYTES_SI, (1.5, 'GB')),
+    (-5, BYTES, (-5, 'B')),
+])
+def test_scale(value, table, expected):
+    assert expected == scale(value, table)
+
+
+def test_scale_unit():
+    assert (2.5, 'kb') == scale(2500, BITS, 'kb')
+    assert (2500, 'b') == scale(2500, BITS, 'b')
+    assert (0.5, 'MiB') == scale(524288, BYTES, 'MiB')
+    with pytest.raises(ValueError):
+        scale(1, BYTES, 'mb')
+
+
+def test_classes():
+    for value in (0, 1, 999, 1000, 1023, 1024, 123456789, 10 ** 12, 1099511627776, 1234.5):
+        assert scale(value, BITS) == UnitBit(value).auto
+        assert scale(value, BYTES) == UnitByte(value).auto
+        assert scale(value, BYTES_NO_THOUSANDS) == UnitByte(value).auto_no_thousands
+        assert UnitByte(value).MiB == scale(value, BYTES, 'MiB')[0]
+
+
+def test_scale_many():
+    values = [0, 1000, 1024, 5 * 1048576, 3.5 * 1073741824]
+    assert [scale(v) for v in values] == scale_many(values)
+    assert [(0, 'B'), (1.0, 'kB'), (1.024, 'kB')] == scale_many(iter(values[:3]), BYTES_SI)
+    assert list() == scale_many(())
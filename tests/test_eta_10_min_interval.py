@@ -0,0 +1,92 @@
+import pytest
+
+from etaprogress import eta
+from etaprogress.progress import ProgressBarYum
+
+
+def test_min_interval():
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(1000, min_interval=1.0)
+    calls = list()
+    original = eta_instance._calculate
+    eta_instance._calculate = lambda: calls.append(1) or original()
+
+    for i in range(1, 41):
+        eta._NOW = lambda: 1411868720.0 + i * 0.25
+        eta_instance.numerator = i * 5
+    assert 200 == eta_instance.numerator
+    assert [0.25, 1.25, 2.25, 3.25, 4.25, 5.25, 6.25, 7.25, 8.25, 9.25] == [x for x, _ in eta_instance._timing_data]
+    assert 9 == len(calls)
+    assert 20.0 == eta_instance.rate
+    assert eta_instance.pending is True  # Set at 10.0 seconds, less than a second since 9.25.
+
+    with pytest.raises(ValueError):
+        eta_instance.numerator = 199
+
+    eta_instance.flush()
+    assert eta_instance.pending is False
+    assert (10.0, 200) == eta_instance._timing_data[-1]
+    assert 10 == len(calls)
+    eta_instance.flush()
+    assert 10 == len(calls)
+
+    # Reaching the denominator is never held back.
+    eta._NOW = lambda: 1411868730.5
+    eta_instance.numerator = 1000
+    assert eta_instance.done is True
+    assert (10.5, 1000) == eta_instance._timing_data[-1]
+
+
+def test_min_interval_read():
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(1000, min_interval=1.0)
+    for i in range(1, 11):
+        eta._NOW = lambda: 1411868720.0 + i * 0.25
+        eta_instance.numerator = i * 50
+    assert 200.0 == eta_instance.rate
+    assert 2.25 == eta_instance.elapsed
+    assert eta_instance.pending is True  # Less than a second since 2.25.
+
+    # No more updates, the held back numerator is added when read after the interval passes.
+    eta._NOW = lambda: 1411868723.5
+    assert 2.5 == eta_instance.elapsed
+    assert eta_instance.pending is False
+    assert (2.5, 500) == eta_instance._timing_data[-1]
+    assert 200.0 == eta_instance.rate
+    assert 1.5 == eta_instance.eta_seconds
+
+
+def test_progress_bar():
+    eta._NOW = lambda: 1411868720.0
+    progress_bar = ProgressBarYum(100, 'file.iso', max_width=60, min_interval=1.0)
+    progress_bar.numerator = 0
+    for i in range(1, 11):
+        eta._NOW = lambda: 1411868720.0 + i * 0.25
+        progress_bar.numerator = i * 5
+        if i == 4:
+            assert '00:00:04' == progress_bar._eta_string
+        if i == 5:
+            progress_bar._eta_string = 'unchanged'
+    assert 50 == progress_bar.numerator
+    assert 'unchanged' != progress_bar._eta_string  # Regenerated once at 2.0 seconds.
+    assert 3 == len(progress_bar._eta._timing_data)
+
+    progress_bar._eta_string = 'unchanged'
+    progress_bar.flush()
+    assert (2.5, 50) == progress_bar._eta._timing_data[-1]
+    assert '00:00:03' == progress_bar._eta_string
+
+
+def test_progress_bar_read():
+    eta._NOW = lambda: 1411868720.0
+    progress_bar = ProgressBarYum(100, 'file.iso', max_width=60, min_interval=1.0)
+    progress_bar.numerator = 0
+    for i in range(1, 11):
+        eta._NOW = lambda: 1411868720.0 + i * 0.25
+        progress_bar.numerator = i * 5
+    progress_bar._eta_string = 'unchanged'
+    assert 'unchanged' == progress_bar._eta_string  # Less than a second since 2.0.
+
+    eta._NOW = lambda: 1411868723.0
+    assert '00:00:02' == progress_bar._eta_string  # Done at 5.0 seconds.
+    assert (2.5, 50) == progress_bar._eta._timing_data[-1]
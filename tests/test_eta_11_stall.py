@@ -0,0 +1,64 @@
+from etaprogress import eta
+from etaprogress.progress import ProgressBarYum
+
+
+def test_seconds_since_progress():
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(100)
+    eta._NOW = lambda: 1411868722.0
+    assert 2.0 == eta_instance.seconds_since_progress
+
+    eta_instance.numerator = 10
+    eta._NOW = lambda: 1411868723.0
+    eta_instance.numerator = 20
+    eta._NOW = lambda: 1411868725.0
+    eta_instance.numerator = 20
+    assert 2.0 == eta_instance.seconds_since_progress
+    assert eta_instance.stalled is False  # No stall_threshold, rate is still above 0.
+
+    eta_instance.extend([(1411868726.0, 20), (1411868727.0, 30), (1411868728.0, 30)])
+    eta._NOW = lambda: 1411868729.0
+    assert 2.0 == eta_instance.seconds_since_progress
+
+
+def test_stall_threshold():
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(100, stall_threshold=5.0)
+    for i in range(5):
+        eta._NOW = lambda: 1411868720.0 + i
+        eta_instance.numerator = i * 10
+    assert 10.0 == eta_instance.rate
+    assert 6.0 == eta_instance.eta_seconds
+    assert eta_instance.stalled is False
+
+    # Hung, nothing is set anymore.
+    eta._NOW = lambda: 1411868729.0
+    assert eta_instance.stalled is True
+    assert 10.0 == eta_instance.rate
+    assert 1.0 == eta_instance.eta_seconds
+
+    eta._NOW = lambda: 1411868734.0
+    assert 5.0 == eta_instance.rate
+    assert 2.0 == eta_instance.eta_seconds  # 60 remaining at 5/s since the last progress 10 seconds ago.
+    eta._NOW = lambda: 1411868744.0
+    assert 2.5 == eta_instance.rate
+    assert 4.0 == eta_instance.eta_seconds
+    assert 0.0 == eta_instance.rate_unstable
+
+    # Resumed.
+    eta_instance.numerator = 50
+    assert eta_instance.stalled is False
+    assert 0.0 == eta_instance.seconds_since_progress
+
+
+def test_progress_bar():
+    eta._NOW = lambda: 1411868720.0
+    progress_bar = ProgressBarYum(100, 'file.iso', max_width=60, stall_threshold=5.0)
+    for i in range(5):
+        eta._NOW = lambda: 1411868720.0 + i
+        progress_bar.numerator = i * 10
+    assert '00:00:06' == progress_bar._eta_string
+
+    eta._NOW = lambda: 1411868744.0
+    assert 2.5 == progress_bar.rate
+    assert '00:00:04' == progress_bar._eta_string
@@ -0,0 +1,122 @@
+import pytest
+
+from etaprogress import eta
+from etaprogress.components import misc
+from etaprogress.components.bars import Bar
+from etaprogress.components.estimators import EstimatorTheilSen
+from etaprogress.progress import ProgressBar, ProgressBarWget, ProgressBarYum
+
+
+def test_round_trip():
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(100, min_interval=0.5)
+    for i in range(1, 9):
+        eta._NOW = lambda: 1411868720.0 + i * 0.25
+        eta_instance.numerator = i * 5
+    eta._NOW = lambda: 1411868723.0
+    data = eta_instance.to_bytes()
+    assert 33 + 5 * 16 == len(data)
+
+    # Restarted a day later.
+    eta._NOW = lambda: 1411955120.0
+    restored = eta.ETA.from_bytes(data, compact=True)
+    assert 100 == restored.denominator
+    assert 40 == restored.numerator
+    assert [(0.25, 5), (0.75, 15), (1.25, 25), (1.75, 35), (2.0, 40)] == list(restored._timing_data)
+    assert 20.0 == restored.rate
+    assert 2.0 == restored.elapsed
+    assert 1.0 == restored.seconds_since_progress
+    assert 2.0 == restored.eta_seconds
+
+    eta._NOW = lambda: 1411955121.0
+    restored.numerator = 60
+    assert (4.0, 60) == restored._timing_data[-1]
+
+
+def test_restore_scope_and_errors():
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(1000)
+    for i in range(1, 21):
+        eta._NOW = lambda: 1411868720.0 + i
+        eta_instance.numerator = i * 10
+    restored = eta.ETA(scope=5)
+    restored.restore(eta_instance.to_bytes())
+    assert [16.0, 17.0, 18.0, 19.0, 20.0] == [x for x, _ in restored._timing_data]
+    assert 10.0 == restored.rate
+
+    with pytest.raises(ValueError):
+        restored.restore(b'ETAP')
+    with pytest.raises(ValueError):
+        restored.restore(eta_instance.to_bytes()[:-1])
+    with pytest.raises(ValueError):
+        restored.restore(b'XXXX' + eta_instance.to_bytes()[4:])
+
+
+def test_pending_same_timestamp(monkeypatch):
+    for name in ('CHAR_FULL', 'CHAR_LEADING'):
+        monkeypatch.setattr(Bar, name, getattr(Bar, name))  # ProgressBarWget changes these.
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(1000, min_interval=1)
+    eta_instance.numerator = 1
+    eta._NOW = lambda: 1411868722.0
+    eta_instance.numerator = 2
+    eta_instance.numerator = 3  # Held back with the same timestamp as the latest entry.
+    data = eta_instance.to_bytes()
+
+    restored = eta.ETA.from_bytes(data, estimator=EstimatorTheilSen())
+    assert [(0.0, 1), (2.0, 3)] == list(restored._timing_data)
+    assert 1.0 == restored.rate_unstable
+    assert 1.0 == restored.rate
+
+    progress_bar = ProgressBarWget.from_bytes(data, eta_every=2)
+    assert ' 0% [' == str(progress_bar)[:5]
+
+
+def test_restore_window_seconds():
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(1000)
+    for i in range(1, 21):
+        eta._NOW = lambda: 1411868720.0 + i
+        eta_instance.numerator = i * 10
+    restored = eta.ETA.from_bytes(eta_instance.to_bytes(), window_seconds=5)
+    assert [15.0, 16.0, 17.0, 18.0, 19.0, 20.0] == [x for x, _ in restored._timing_data]
+    assert 10.0 == restored.rate
+
+
+def test_progress_bar():
+    eta._NOW = lambda: 1411868720.0
+    progress_bar = ProgressBarYum(100, 'file.iso', max_width=60)
+    for i in range(1, 5):
+        eta._NOW = lambda: 1411868720.0 + i
+        progress_bar.numerator = i * 10
+
+    data = progress_bar.to_bytes()
+    eta._NOW = lambda: 1411955120.0
+    restored = ProgressBarYum.from_bytes(data, 'file.iso', max_width=60)
+    assert 100 == restored.denominator
+    assert 40 == restored.numerator
+    assert 10.0 == restored.rate
+    assert progress_bar._eta_string == restored._eta_string == '00:00:06'
+
+
+@pytest.mark.parametrize('cls,expected', [
+    (ProgressBar, ' 40% ( 40/100) [############                   ] eta 00:06 '),
+    (ProgressBarWget, '40% [======>           ] 40            10.0B/s  eta 6s      '),
+])
+def test_progress_bar_render(monkeypatch, cls, expected):
+    for name in ('CHAR_FULL', 'CHAR_LEADING'):
+        monkeypatch.setattr(Bar, name, getattr(Bar, name))  # ProgressBarWget changes these.
+    monkeypatch.setattr(misc, 'terminal_width', lambda: 80)
+    eta._NOW = lambda: 1411868720.0
+    progress_bar = cls(100, max_width=60)
+    for i in range(1, 5):
+        eta._NOW = lambda: 1411868720.0 + i
+        progress_bar.numerator = i * 10
+
+    data = progress_bar.to_bytes()
+    eta._NOW = lambda: 1411955120.0
+    restored = cls.from_bytes(data, max_width=60)
+    assert restored.undefined is False
+    for _ in range(2):  # Spinner goes around once.
+        assert str(progress_bar).startswith(expected)
+        assert str(restored).startswith(expected)
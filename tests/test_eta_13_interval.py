@@ -0,0 +1,50 @@
+from etaprogress import eta
+from etaprogress.components.estimators import EstimatorKalman, EstimatorTheilSen
+
+
+def test_interval():
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(1000)
+    assert (None, None) == eta_instance.eta_interval()
+    assert eta_instance.rate_error is None
+
+    for i, numerator in enumerate((0, 12, 18, 31, 39, 52, 58, 71)):
+        eta._NOW = lambda: 1411868720.0 + i
+        eta_instance.numerator = numerator
+
+    rate, error, eta_seconds = eta_instance.rate, eta_instance.rate_error, eta_instance.eta_seconds
+    assert 0 < error < rate
+    assert eta_instance.eta_low < eta_seconds < eta_instance.eta_high
+    assert abs(eta_instance.eta_low - eta_seconds * rate / (rate + 1.96 * error)) < 1e-9
+    low, high = eta_instance.eta_interval(z=1.0)
+    assert eta_instance.eta_low < low < eta_seconds < high < eta_instance.eta_high
+
+
+def test_interval_perfect_and_unbounded():
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(100)
+    for i in range(5):
+        eta._NOW = lambda: 1411868720.0 + i
+        eta_instance.numerator = i * 10
+    assert 0.0 == eta_instance.rate_error
+    assert (6.0, 6.0) == eta_instance.eta_interval()
+
+    eta_instance = eta.ETA(100)
+    for i, numerator in enumerate((0, 30, 30, 30)):
+        eta._NOW = lambda: 1411868730.0 + i
+        eta_instance.numerator = numerator
+    low, high = eta_instance.eta_interval()
+    assert low < eta_instance.eta_seconds
+    assert high is None
+
+
+def test_estimators():
+    eta._NOW = lambda: 1411868720.0
+    kalman, theil_sen = eta.ETA(1000, estimator=EstimatorKalman()), eta.ETA(1000, estimator=EstimatorTheilSen())
+    for i, numerator in enumerate((0, 12, 18, 31, 39, 52)):
+        eta._NOW = lambda: 1411868720.0 + i
+        kalman.numerator = theil_sen.numerator = numerator
+    assert kalman.rate_error > 0
+    assert kalman.eta_low < kalman.eta_seconds < kalman.eta_high
+    assert theil_sen.rate_error is None
+    assert (None, None) == theil_sen.eta_interval()
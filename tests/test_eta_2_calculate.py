@@ -5,6 +5,7 @@ from etaprogress.eta import ETA
 
 def test_linear_slope_1():
     eta = ETA(100)
+    eta._start_time = 0.0
     eta._timing_data = deque([(10, 10), (20, 20), (30, 30), (40, 40)])
     getattr(eta, '_calculate')()
 
@@ -15,6 +16,7 @@ def test_linear_slope_1():
 
 def test_linear_slope_2():
     eta = ETA(100)
+    eta._start_time = 0.0
     eta._timing_data = deque([(10, 20), (20, 40), (30, 60), (40, 80)])
     getattr(eta, '_calculate')()
 
@@ -33,6 +35,7 @@ def test_linear_transform():
     This avoids having 99% with an ETA in the past.
     """
     eta = ETA(120)
+    eta._start_time = 0.0
     eta._timing_data = deque([(1.2, 22), (2.4, 58), (3.1, 102), (4.4, 118)])
     getattr(eta, '_calculate')()
 
@@ -43,6 +46,7 @@ def test_linear_transform():
 
 def test_linear_transform_undefined():
     eta = ETA()
+    eta._start_time = 0.0
     eta._timing_data = deque([(1.2, 22), (2.4, 58), (3.1, 102), (4.4, 118)])
     getattr(eta, '_calculate')()
 
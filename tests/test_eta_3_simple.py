@@ -101,3 +101,16 @@ def test_five():
     assert eta_instance.done is True
     assert 100.0 == eta_instance.percent
     assert 5.0 == eta_instance.elapsed
+
+
+def test_high_frequency():
+    """Sub-millisecond updates on an epoch-sized clock must not be drowned out by the clock's magnitude."""
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(1000000, scope=1000)
+    for i in range(1, 1001):
+        eta._NOW = lambda: 1411868720.0 + i * 0.0001
+        eta_instance.numerator = i * 10
+
+    assert abs(eta_instance.rate - 100000.0) < 0.01
+    assert abs(eta_instance.eta_seconds - 9.9) < 0.001
+    assert 0.0999 < eta_instance.elapsed < 0.1001
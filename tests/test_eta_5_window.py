@@ -0,0 +1,45 @@
+from etaprogress import eta
+from etaprogress.progress import ProgressBar
+
+
+def test_evict_by_age():
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(10000, scope=100, window_seconds=10)
+    for i in range(1, 31):
+        eta._NOW = lambda: 1411868720.0 + i
+        eta_instance.numerator = i * 5
+
+    assert [(i, i * 5) for i in range(20, 31)] == list(eta_instance._timing_data)
+    assert 11 == eta_instance._estimator.regression.n
+    assert 5.0 == eta_instance.rate
+
+
+def test_coalesce_fast_updates():
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(100000000, scope=20, window_seconds=1)
+    for i in range(1, 20001):
+        eta._NOW = lambda: 1411868720.0 + i * 0.0001
+        eta_instance.numerator = i * 10
+
+    timing_data = list(eta_instance._timing_data)
+    assert len(timing_data) <= 20
+    assert (2.0, 200000) == (round(timing_data[-1][0], 6), timing_data[-1][1])
+    assert timing_data[0][0] >= 1.0 - eta_instance._window_spacing
+    assert abs(eta_instance.rate - 100000.0) < 0.01
+
+
+def test_slow_updates_keep_two():
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(100, window_seconds=5)
+    for i in range(1, 4):
+        eta._NOW = lambda: 1411868720.0 + i * 60
+        eta_instance.numerator = i * 10
+
+    assert [(120.0, 20), (180.0, 30)] == list(eta_instance._timing_data)
+    assert abs(eta_instance.rate - (1 / 6.0)) < 1e-9
+
+
+def test_progress_bar():
+    progress_bar = ProgressBar(1000, window_seconds=30, scope=10)
+    assert 30 == progress_bar._eta.window_seconds
+    assert 10 == progress_bar._eta._timing_data.maxlen
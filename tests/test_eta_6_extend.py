@@ -0,0 +1,72 @@
+import pytest
+
+from etaprogress import eta
+from etaprogress.progress import ProgressBar
+
+
+def test_matches_set_numerator():
+    eta._NOW = lambda: 1411868720.0
+    one_by_one = eta.ETA(1000, scope=10)
+    batched = eta.ETA(1000, scope=10)
+    pairs = [(1411868720.0 + i * 0.5, i * i) for i in range(1, 31)]
+    for t, n in pairs:
+        eta._NOW = lambda: t
+        one_by_one.numerator = n
+    batched.extend(pairs[:5])
+    batched.extend(iter(pairs[5:]))
+
+    assert list(one_by_one._timing_data) == list(batched._timing_data)
+    assert one_by_one.rate == batched.rate
+    assert one_by_one.eta_epoch == batched.eta_epoch
+    assert 900 == batched.numerator
+
+
+def test_single_calculation():
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(1000)
+    calls = list()
+    eta_instance._calculate = lambda: calls.append(1)
+    eta_instance.extend([(1411868721.0, 1), (1411868722.0, 2), (1411868723.0, 3)])
+    assert 1 == len(calls)
+
+    eta_instance.extend([])
+    assert 1 == len(calls)
+
+
+def test_errors():
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(1000)
+    eta_instance.extend([(1411868721.0, 10), (1411868722.0, 20)])
+
+    with pytest.raises(ValueError):
+        eta_instance.extend([(1411868723.0, 30), (1411868724.0, 25)])
+    with pytest.raises(ValueError):
+        eta_instance.extend([(1411868724.0, 30), (1411868723.0, 35)])
+    with pytest.raises(ValueError) as e:
+        eta_instance.extend([(1411868723.0, 15)])
+    assert 'numerator cannot decrement.' == str(e.value)
+    with pytest.raises(ValueError) as e:
+        eta_instance.extend([(1411868721.5, 25)])
+    assert 'timestamps cannot decrement.' == str(e.value)
+
+    assert 20 == eta_instance.numerator  # Nothing was added.
+
+
+def test_numpy():
+    numpy = pytest.importorskip('numpy')
+    eta._NOW = lambda: 1411868720.0
+    eta_instance = eta.ETA(1000)
+    eta_instance.extend(numpy.array([(1411868721.0, 10), (1411868722.0, 20)]))
+    assert 10.0 == eta_instance.rate
+
+    with pytest.raises(ValueError):
+        eta_instance.extend(numpy.array([(1411868723.0, 30), (1411868724.0, 25)]))
+
+
+def test_progress_bar():
+    eta._NOW = lambda: 1411868720.0
+    progress_bar = ProgressBar(100, max_width=40)
+    progress_bar.extend([(1411868721.0, 10), (1411868722.0, 20)])
+    assert 20 == progress_bar.numerator
+    assert 10.0 == progress_bar.rate
+    assert '00:10' == progress_bar._eta_string  # Clock hasn't moved since the progress bar was created.
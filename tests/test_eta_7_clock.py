@@ -0,0 +1,63 @@
+import time
+
+from etaprogress import eta
+from etaprogress.progress import ProgressBarBytes
+
+
+class FakeClock(object):
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_instance_clock():
+    eta._NOW = lambda: 1411868720.0  # Must be ignored.
+    clock = FakeClock(50.0)
+    eta_instance = eta.ETA(100, clock=clock)
+
+    clock.now = 51.0
+    eta_instance.numerator = 10
+    clock.now = 52.0
+    eta_instance.numerator = 20
+
+    assert 10.0 == eta_instance.rate
+    assert 60.0 == eta_instance.eta_epoch
+    assert 8.0 == eta_instance.eta_seconds
+    assert 2.0 == eta_instance.elapsed
+
+    clock.now = 56.0
+    assert 4.0 == eta_instance.eta_seconds
+    assert abs(eta_instance.eta_wall_epoch - (time.time() + 4.0)) < 1.0
+
+
+def test_independent_clocks():
+    clock_a, clock_b = FakeClock(0.0), FakeClock(1000.0)
+    eta_a, eta_b = eta.ETA(100, clock=clock_a), eta.ETA(100, clock=clock_b)
+    for i in range(1, 5):
+        clock_a.now += 1.0
+        clock_b.now += 2.0
+        eta_a.numerator = eta_b.numerator = i * 10
+
+    assert 10.0 == eta_a.rate
+    assert 5.0 == eta_b.rate
+    assert 6.0 == eta_a.eta_seconds
+    assert 12.0 == eta_b.eta_seconds
+
+
+def test_default_clock():
+    eta_instance = eta.ETA(100)
+    assert eta_instance.eta_wall_epoch is None
+    assert eta_instance._clock is None
+
+
+def test_progress_bar():
+    clock = FakeClock(10.0)
+    progress_bar = ProgressBarBytes(1000, clock=clock)
+    clock.now = 11.0
+    progress_bar.numerator = 100
+    clock.now = 12.0
+    progress_bar.numerator = 300
+    assert 200.0 == progress_bar.rate
+    assert '00:04' == progress_bar._eta_string
@@ -0,0 +1,53 @@
+from etaprogress import eta
+from etaprogress.progress import ProgressBarYum
+
+
+def test_lazy():
+    eta._NOW = lambda: 1411868720.0
+    eager = eta.ETA(100)
+    lazy = eta.ETA(100, lazy=True)
+    calls = list()
+    original = lazy._calculate
+    lazy._calculate = lambda: calls.append(1) or original()
+
+    for i in range(1, 6):
+        eta._NOW = lambda: 1411868720.0 + i
+        eager.numerator = i * 10
+        lazy.numerator = i * 10
+    assert not calls
+
+    assert eager.rate == lazy.rate
+    assert eager.eta_epoch == lazy.eta_epoch
+    assert eager.eta_seconds == lazy.eta_seconds
+    assert 1 == len(calls)
+
+    eta._NOW = lambda: 1411868726.0
+    eager.numerator = lazy.numerator = 65
+    assert eager.eta_seconds == lazy.eta_seconds
+    assert eager.stalled is lazy.stalled is False
+    assert 2 == len(calls)
+
+
+def test_lazy_done():
+    eta._NOW = lambda: 1411868720.0
+    lazy = eta.ETA(20, lazy=True)
+    for i in range(1, 3):
+        eta._NOW = lambda: 1411868720.0 + i
+        lazy.numerator = i * 10
+    assert lazy.done is True
+    assert lazy.eta_epoch is None  # Never calculated, same as eager when the last update finishes.
+    assert 2.0 == lazy.elapsed
+
+
+def test_progress_bar():
+    eta._NOW = lambda: 1411868720.0
+    eager = ProgressBarYum(100000000, 'file.iso', max_width=60)
+    lazy = ProgressBarYum(100000000, 'file.iso', max_width=60, lazy=True)
+    for i in range(1, 12):
+        eta._NOW = lambda: 1411868720.0 + i * 0.5
+        eager.numerator = lazy.numerator = i * 3000000
+        if i % 3:
+            continue
+        assert lazy._eta_string_stale is True
+        assert str(eager) == str(lazy)
+        assert lazy._eta_string_stale is False
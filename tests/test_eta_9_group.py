@@ -0,0 +1,119 @@
+import pytest
+
+from etaprogress import eta
+from etaprogress.progress import ProgressBarYum
+
+
+def test_group():
+    eta._NOW = lambda: 1411868720.0
+    first, second = eta.ETA(100), eta.ETA(300)
+    group = eta.ETAGroup([first, second], lazy=False)
+    assert 2 == len(group)
+    assert 400 == group.denominator
+    assert group.eta_seconds is None
+
+    for i in range(1, 5):
+        eta._NOW = lambda: 1411868720.0 + i
+        first.numerator = i * 10
+        second.numerator = i * 30
+
+    assert 160 == group.numerator
+    assert 400 == group.denominator
+    assert 40.0 == group.percent
+    assert 40.0 == group.rate
+    assert 6.0 == group.eta_seconds
+
+    # Weighted child joining late, its earlier progress isn't counted.
+    third = eta.ETA(50)
+    third.numerator = 10
+    group.add(third, weight=2)
+    assert 160 == group.numerator
+    assert 160 + 240 + 80 == group.denominator
+
+    # Leaving child, its remaining work no longer counts.
+    group.remove(first)
+    assert 160 + 180 + 80 == group.denominator
+    assert first._group is None
+    first.numerator = 100
+    assert 160 == group.numerator
+
+    eta._NOW = lambda: 1411868730.0
+    second.numerator = 300
+    third.numerator = 50
+    assert 420 == group.numerator == group.denominator
+    assert group.done is True
+    assert group.eta_seconds is None
+
+
+def test_group_restore():
+    eta._NOW = lambda: 1411868720.0
+    checkpoint, child = eta.ETA(100), eta.ETA(100)
+    checkpoint.numerator = 40
+    group = eta.ETAGroup([child], lazy=False)
+    eta._NOW = lambda: 1411868721.0
+    child.numerator = 70
+    assert 70 == group.numerator
+    assert 100 == group.denominator
+
+    # Restoring doesn't count as progress (or regress), only the remaining work changes.
+    child.restore(checkpoint.to_bytes())
+    assert 70 == group.numerator
+    assert 70 + 60 == group.denominator
+    eta._NOW = lambda: 1411868722.0
+    child.numerator = 45
+    assert 75 == group.numerator
+    assert 75 + 55 == group.denominator
+
+
+def test_group_undefined():
+    eta._NOW = lambda: 1411868720.0
+    assert eta.ETAGroup().undefined is True
+
+    child = eta.ETA()
+    group = eta.ETAGroup([child, eta.ETA(100)])
+    assert group.undefined is True
+    child.numerator = 10
+    assert group.undefined is True
+
+    child.denominator = 20  # Picked up on the next update.
+    eta._NOW = lambda: 1411868721.0
+    child.numerator = 15
+    assert group.undefined is False
+    assert 15 + 5 + 100 == group.denominator
+
+    with pytest.raises(ValueError):
+        eta.ETAGroup([child])
+
+
+def test_group_progress_bars():
+    eta._NOW = lambda: 1411868720.0
+    bars = [ProgressBarYum(1000, 'file{0}.iso'.format(i), max_width=60) for i in range(100)]
+    group = eta.ETAGroup(bars)
+    assert 100000 == group.denominator
+
+    for i in range(1, 4):
+        eta._NOW = lambda: 1411868720.0 + i
+        for progress_bar in bars:
+            progress_bar.numerator = i * 100
+
+    assert 30000 == group.numerator
+    assert 10000.0 == group.rate
+    assert 7.0 == group.eta_seconds
+
+
+def test_group_many_children_stable_rate():
+    children = [eta.ETA(10 ** 9) for _ in range(50)]
+    group = eta.ETAGroup(children)
+    assert 60 == group._eta.window_seconds
+
+    # Each child does 1000 units/s and updates 4 times per second at staggered times. True rate is 50,000.
+    rates = list()
+    for step in range(240):
+        for i, child in enumerate(children):
+            now = 1411868720.0 + step * 0.25 + i * 0.005
+            eta._NOW = lambda: now
+            child.numerator = int(1000 * (now - 1411868720.0))
+        if step >= 40:
+            rates.append(group.rate)
+    assert 49000 < min(rates)
+    assert max(rates) < 51000
@@ -1,14 +1,21 @@
+import pytest
+
 from etaprogress import eta
 from etaprogress.components import misc
 from etaprogress.progress import ProgressBar
 
 
-def test_terminal_width():
+@pytest.fixture(autouse=True)
+def terminal_width(monkeypatch):
+    monkeypatch.setattr(misc, 'terminal_width', lambda: 40)
+
+
+
+def test_terminal_width(real_terminal_width):
     assert 80 == misc.terminal_width()
 
 
 def test_undefined():
-    misc.terminal_width = lambda: 40
     progress_bar = ProgressBar(None, max_width=30)
 
     assert '0 [?             ] eta --:-- /' == str(progress_bar)
@@ -173,3 +180,40 @@ def test_defined_long():
     eta._NOW = lambda: 1411868731.5
     progress_bar.numerator = 20
     assert '100% (20/20) [#############] eta 00:00 |' == str(progress_bar)
+
+
+def test_render_cache(monkeypatch):
+    eta._NOW = lambda: 1411868720.0
+    progress_bar = ProgressBar(20, max_width=35)
+    built = list()
+    original = progress_bar._build_segments
+    progress_bar._build_segments = lambda available: built.append(available) or original(available)
+
+    first, second = str(progress_bar), str(progress_bar)
+    assert first[:-1] == second[:-1]
+    assert first[-1] != second[-1]  # Spinner is still redrawn.
+    assert [35] == built
+
+    monkeypatch.setattr(misc, 'terminal_width', lambda: 30)
+    assert 30 == len(str(progress_bar))
+    assert [35, 30] == built
+
+    progress_bar.numerator = 10
+    assert ' 50% (10/20) [#  ] eta --:-- ' == str(progress_bar)[:-1]
+    assert [35, 30, 30] == built
+
+    progress_bar.template = '{percent:3d}% {bar} {spinner}'
+    assert ' 50% [##########           ] ' == str(progress_bar)[:-1]
+    assert [35, 30, 30, 30] == built
+
+    for _ in range(3):
+        str(progress_bar)  # Leave the spinner where it was for other tests.
+    assert [35, 30, 30, 30] == built
+
+
+def test_render_cache_undefined():
+    progress_bar = ProgressBar(None, max_width=20)
+    assert '0 [?   ] eta --:--' == str(progress_bar)[:-2]
+    assert '0 [ ?  ] eta --:--' == str(progress_bar)[:-2]  # Animated bar is redrawn from the cached template.
+    assert '0 [  ? ] eta --:--' == str(progress_bar)[:-2]
+    assert '0 [   ?] eta --:--' == str(progress_bar)[:-2]
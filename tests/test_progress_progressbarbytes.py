@@ -1,10 +1,17 @@
+import pytest
+
 from etaprogress import eta
 from etaprogress.components import misc
 from etaprogress.progress import ProgressBarBytes
 
 
+@pytest.fixture(autouse=True)
+def terminal_width(monkeypatch):
+    monkeypatch.setattr(misc, 'terminal_width', lambda: 50)
+
+
+
 def test_undefined():
-    misc.terminal_width = lambda: 50
     progress_bar = ProgressBarBytes(None, max_width=30)
 
     assert '0 B [?           ] eta --:-- /' == str(progress_bar)
@@ -98,8 +105,8 @@ def test_defined_wont_fit():
     assert '  0% (0.00/1.95 KiB) [] eta --:-- /' == str(progress_bar)
 
 
-def test_defined_long():
-    misc.terminal_width = lambda: 42
+def test_defined_long(monkeypatch):
+    monkeypatch.setattr(misc, 'terminal_width', lambda: 42)
     progress_bar = ProgressBarBytes(20)
 
     assert '  0% ( 0/20 B) [             ] eta --:-- -' == str(progress_bar)
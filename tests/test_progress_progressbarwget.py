@@ -1,10 +1,17 @@
+import pytest
+
 from etaprogress import eta
 from etaprogress.components import misc
 from etaprogress.progress import ProgressBarWget
 
 
+@pytest.fixture(autouse=True)
+def terminal_width(monkeypatch):
+    monkeypatch.setattr(misc, 'terminal_width', lambda: 60)
+
+
+
 def test_undefined():
-    misc.terminal_width = lambda: 60
     eta._NOW = lambda: 1411868721.5
     progress_bar = ProgressBarWget(None, max_width=55)
 
@@ -213,8 +220,8 @@ def test_overflow_eta_caching():
     assert '100%[=============>] 500,000,000,000 62.1GiB/s   in 8s      ' == str(progress_bar)
 
 
-def test_defined_long():
-    misc.terminal_width = lambda: 45
+def test_defined_long(monkeypatch):
+    monkeypatch.setattr(misc, 'terminal_width', lambda: 45)
     eta._NOW = lambda: 1411868721.5
     progress_bar = ProgressBarWget(20)
 
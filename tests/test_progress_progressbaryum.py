@@ -1,10 +1,17 @@
+import pytest
+
 from etaprogress import eta
 from etaprogress.components import misc
 from etaprogress.progress import ProgressBarYum
 
 
+@pytest.fixture(autouse=True)
+def terminal_width(monkeypatch):
+    monkeypatch.setattr(misc, 'terminal_width', lambda: 60)
+
+
+
 def test_undefined():
-    misc.terminal_width = lambda: 60
     eta._NOW = lambda: 1411868721.5
     progress_bar = ProgressBarYum(None, '', max_width=55)
 
@@ -147,8 +154,8 @@ def test_defined_wont_fit():
     assert ' |   0.0 B  00:00:00    ' == str(progress_bar)
 
 
-def test_defined_long():
-    misc.terminal_width = lambda: 50
+def test_defined_long(monkeypatch):
+    monkeypatch.setattr(misc, 'terminal_width', lambda: 50)
     eta._NOW = lambda: 1411868721.5
     progress_bar = ProgressBarYum(20, 'a.iso')
 
@@ -235,3 +242,23 @@ def test_defined_long():
     eta._NOW = lambda: 1411868731.5
     progress_bar.numerator = 20
     assert 'a.iso                      |    20 B  00:00:10    ' == str(progress_bar)
+
+
+def test_render_cache(monkeypatch):
+    monkeypatch.setattr(misc, 'terminal_width', lambda: 50)
+    eta._NOW = lambda: 1411868720.0
+    progress_bar = ProgressBarYum(20, 'a.iso')
+    progress_bar.numerator = 10
+    built = list()
+    original = progress_bar._build_segments
+    progress_bar._build_segments = lambda available: built.append(available) or original(available)
+    first = str(progress_bar)
+    assert first == str(progress_bar)
+    assert [50] == built
+
+    progress_bar.filename = 'b.iso'
+    assert first.replace('a.is', 'b.is') == str(progress_bar)
+
+    progress_bar.force_done = True
+    assert str(progress_bar).startswith('b.iso ')
+    assert str(progress_bar).endswith('|    10 B  00:00:00    ')